@@ -1,39 +1,107 @@
 """Menstrual Cycle Tracker integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
-from typing import Any
+from functools import partial
+from typing import Any, NamedTuple
+from uuid import uuid4
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_time,
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import (
+    ARCHIVE_INTERVAL,
     ATTR_DAYS_OVERDUE,
     ATTR_IS_PMS_WINDOW,
+    CONF_ARCHIVE_MONTHS,
+    CONF_SAVE_DELAY,
+    CONF_STORAGE_MODE,
+    DATA_DAY_ROLLOVER,
+    DATA_ICS_VIEW,
+    DATA_TRACKER_INDEX,
+    DEFAULT_ARCHIVE_MONTHS,
     DEFAULT_CYCLE_LENGTH,
     DEFAULT_PERIOD_LENGTH,
+    DEFAULT_SAVE_DELAY,
     DOMAIN,
+    EVENT_FERTILE_WINDOW_END,
+    EVENT_FERTILE_WINDOW_START,
+    EVENT_OVULATION,
+    EVENT_PERIOD_DUE,
+    EVENT_PERIOD_END_EXPECTED,
+    EVENT_PERIOD_OVERDUE,
+    EVENT_PMS_WINDOW_START,
+    EXPORT_DIRECTORY,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_JSON,
+    JOURNAL_COMPACT_INTERVAL,
+    JOURNAL_MAX_RECORDS,
+    PERIOD_DUE_NOTICE_DAYS,
     PHASE_FOLLICULAR,
     PHASE_LUTEAL,
     PHASE_MENSTRUAL,
     PHASE_OVULATION,
     PHASE_UNKNOWN,
+    SERVICE_BATCH,
     SERVICE_DELETE_CYCLE,
     SERVICE_DELETE_SYMPTOM,
     SERVICE_EDIT_CYCLE,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_GET_CYCLE_SUMMARY,
+    SERVICE_GET_PREDICTIONS,
+    SERVICE_IMPORT_HISTORY,
     SERVICE_LOG_PERIOD_END,
     SERVICE_LOG_PERIOD_START,
     SERVICE_LOG_SYMPTOM,
+    SERVICE_SEARCH_SYMPTOMS,
     SIGNAL_UPDATE,
+    STORAGE_MODE_JOURNAL,
     STORAGE_VERSION,
 )
+from .history import (
+    OPEN_END,
+    STATS_WINDOW,
+    Cycle,
+    CycleHistory,
+    CycleSnapshot,
+    SymptomLog,
+)
+from .ics import CycleCalendarFeedView
+from .statistics import (
+    async_clear_statistics,
+    async_publish_statistics,
+    cycle_statistics,
+    statistics_enabled,
+)
+from .storage import CycleArchive, CycleJournal, CycleStore, ExportSource, write_export
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,24 +147,167 @@ SERVICE_DELETE_SYMPTOM_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_IMPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("tracker"): cv.string,
+        vol.Optional("cycles", default=list): [
+            vol.Schema(
+                {
+                    vol.Required("start_date"): cv.string,
+                    vol.Optional("end_date"): vol.Any(None, cv.string),
+                }
+            )
+        ],
+        vol.Optional("symptoms", default=list): [
+            vol.Schema(
+                {
+                    vol.Required("date"): cv.string,
+                    vol.Required("symptom"): cv.string,
+                    vol.Optional("severity", default=""): vol.In(
+                        ["", "mild", "moderate", "severe"]
+                    ),
+                }
+            )
+        ],
+    }
+)
+
+_OPERATION_SCHEMAS: dict[str, vol.Schema] = {
+    SERVICE_LOG_PERIOD_START: SERVICE_LOG_PERIOD_SCHEMA,
+    SERVICE_LOG_PERIOD_END: SERVICE_LOG_PERIOD_SCHEMA,
+    SERVICE_LOG_SYMPTOM: SERVICE_LOG_SYMPTOM_SCHEMA,
+    SERVICE_EDIT_CYCLE: SERVICE_EDIT_CYCLE_SCHEMA,
+    SERVICE_DELETE_CYCLE: SERVICE_DELETE_CYCLE_SCHEMA,
+    SERVICE_DELETE_SYMPTOM: SERVICE_DELETE_SYMPTOM_SCHEMA,
+}
+
+
+def _batch_operation(value: Any) -> dict[str, Any]:
+    """Validate one batch operation against the schema of the service it names."""
+    value = vol.Schema(
+        {vol.Required("action"): vol.In(list(_OPERATION_SCHEMAS))}, extra=vol.ALLOW_EXTRA
+    )(value)
+    fields = {key: item for key, item in value.items() if key != "action"}
+    if "tracker" in fields:
+        raise vol.Invalid("set the tracker on the batch call, not on an operation")
+    return {"action": value["action"], **_OPERATION_SCHEMAS[value["action"]](fields)}
+
+
+SERVICE_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional("tracker"): cv.string,
+        vol.Required("operations"): vol.All(
+            cv.ensure_list, vol.Length(min=1), [_batch_operation]
+        ),
+    }
+)
+
+SERVICE_GET_CYCLE_SUMMARY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("tracker"): cv.string,
+    }
+)
+
+SERVICE_GET_PREDICTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("tracker"): cv.string,
+        vol.Optional("count", default=3): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+    }
+)
+
+SERVICE_SEARCH_SYMPTOMS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("tracker"): cv.string,
+        vol.Optional("symptom"): cv.string,
+        vol.Optional("severity"): vol.In(["", "mild", "moderate", "severe"]),
+        vol.Optional("start_date"): cv.string,
+        vol.Optional("end_date"): cv.string,
+        vol.Optional("limit", default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+        vol.Optional("cursor"): vol.Match(r"^\d+:\d+$"),
+    }
+)
+
+SERVICE_EXPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("tracker"): cv.string,
+        vol.Optional("format", default=EXPORT_FORMAT_CSV): vol.In(
+            [EXPORT_FORMAT_CSV, EXPORT_FORMAT_JSON]
+        ),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Menstrual Cycle Tracker from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
     cycle_data = CycleData(hass, entry)
-    await cycle_data.async_load()
     hass.data[DOMAIN][entry.entry_id] = cycle_data
+    _rebuild_tracker_index(hass)
+    # Storage is read in the background so trackers load concurrently and
+    # startup does not wait on them; entities are unavailable until loaded.
+    entry.async_create_background_task(
+        hass, cycle_data.async_load(), f"{DOMAIN} load {entry.title}"
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     # Register services once globally; subsequent entries reuse the same handlers.
     if not hass.services.has_service(DOMAIN, SERVICE_LOG_PERIOD_START):
         _register_services(hass)
 
+    # One timer for every tracker; fires at midnight in Home Assistant's time zone.
+    if DATA_DAY_ROLLOVER not in hass.data:
+        hass.data[DATA_DAY_ROLLOVER] = async_track_time_change(
+            hass, partial(_async_day_rollover, hass), hour=0, minute=0, second=0
+        )
+
+    # Views cannot be removed, so the feed is registered once per run.
+    if DATA_ICS_VIEW not in hass.data:
+        hass.http.register_view(CycleCalendarFeedView())
+        hass.data[DATA_ICS_VIEW] = True
+
     return True
 
 
+@callback
+def _async_day_rollover(hass: HomeAssistant, _now: datetime) -> None:
+    """Refresh every tracker's date-dependent state when the local date changes."""
+    for cd in hass.data[DOMAIN].values():
+        cd.async_refresh_day()
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+class _TrackerIndex(NamedTuple):
+    """Service target lookup tables, rebuilt whenever the set of trackers changes."""
+
+    # Lowercased tracker name -> entry_id
+    names: dict[str, str]
+    # Tracker names for error messages
+    available: str
+
+
+def _rebuild_tracker_index(hass: HomeAssistant) -> None:
+    """Rebuild the tracker index from the loaded entries.
+
+    Called when an entry is set up or unloaded. Renaming a tracker or
+    changing its options reloads the entry, which rebuilds it too.
+    """
+    names: dict[str, str] = {}
+    for eid, cd in hass.data[DOMAIN].items():
+        # The first tracker with a given name wins, as the lookup always has.
+        names.setdefault(cd.entry.data.get("name", "").lower(), eid)
+    hass.data[DATA_TRACKER_INDEX] = _TrackerIndex(
+        names,
+        ", ".join(cd.entry.data.get("name", eid) for eid, cd in hass.data[DOMAIN].items()),
+    )
+
+
 def _resolve_tracker(hass: HomeAssistant, call: ServiceCall) -> tuple[CycleData | None, str | None]:
     """Return (CycleData, entry_id) for the targeted tracker, or (None, None) on error.
 
@@ -104,24 +315,17 @@ def _resolve_tracker(hass: HomeAssistant, call: ServiceCall) -> tuple[CycleData
     or a tracker name string (for use in automations/scripts).
     """
     loaded: dict[str, CycleData] = hass.data[DOMAIN]
+    index: _TrackerIndex = hass.data[DATA_TRACKER_INDEX]
     requested = call.data.get("tracker", "").strip()
 
     if requested:
         # 1. Direct entry_id match (config_entry selector returns entry_id)
-        if requested in loaded:
-            return loaded[requested], requested
         # 2. Name match (case-insensitive, for automations using plain text)
-        for eid, cd in loaded.items():
-            config_entry = hass.config_entries.async_get_entry(eid)
-            if config_entry and config_entry.data.get("name", "").lower() == requested.lower():
-                return cd, eid
-        available = ", ".join(
-            hass.config_entries.async_get_entry(e).data.get("name", e)
-            for e in loaded
-            if hass.config_entries.async_get_entry(e)
-        )
+        eid = requested if requested in loaded else index.names.get(requested.lower())
+        if eid is not None:
+            return loaded[eid], eid
         _LOGGER.error(
-            "Tracker '%s' not found. Available trackers: %s", requested, available or "none"
+            "Tracker '%s' not found. Available trackers: %s", requested, index.available or "none"
         )
         return None, None
 
@@ -129,158 +333,309 @@ def _resolve_tracker(hass: HomeAssistant, call: ServiceCall) -> tuple[CycleData
         eid = next(iter(loaded))
         return loaded[eid], eid
 
-    available = ", ".join(
-        hass.config_entries.async_get_entry(e).data.get("name", e)
-        for e in loaded
-        if hass.config_entries.async_get_entry(e)
-    )
     _LOGGER.error(
-        "Multiple trackers configured (%s). Select a tracker in the service call.", available
+        "Multiple trackers configured (%s). Select a tracker in the service call.",
+        index.available,
     )
     return None, None
 
 
-def _register_services(hass: HomeAssistant) -> None:
-    """Register domain services (called once when the first entry loads)."""
+async def _async_resolve_tracker(
+    hass: HomeAssistant, call: ServiceCall
+) -> tuple[CycleData | None, str | None]:
+    """Resolve the targeted tracker, waiting for it to finish loading."""
+    cd, eid = _resolve_tracker(hass, call)
+    if cd is not None and not await cd.async_wait_loaded():
+        _LOGGER.error("Tracker '%s' failed to load; see earlier errors.", cd.entry.title)
+        return None, None
+    return cd, eid
 
-    async def handle_log_period_start(call: ServiceCall) -> None:
-        cd, eid = _resolve_tracker(hass, call)
-        if cd is None:
-            return
-        date_str = call.data.get("date", date.today().strftime("%m/%d/%y"))
+
+def _parse_import_date(value: str) -> date | None:
+    """Parse an imported date given as MM/DD/YY or YYYY-MM-DD, or return None."""
+    for fmt in ("%m/%d/%y", "%Y-%m-%d"):
         try:
-            period_date = datetime.strptime(date_str, "%m/%d/%y").date()
+            return datetime.strptime(value, fmt).date()
         except ValueError:
-            _LOGGER.error("Invalid date format: %s. Use MM/DD/YY (e.g. 02/12/26).", date_str)
-            return
-        await cd.log_period_start(period_date)
-        async_dispatcher_send(hass, f"{SIGNAL_UPDATE}_{eid}")
+            continue
+    return None
+
+
+def _parse_service_date(value: str, field: str) -> date | None:
+    """Parse an MM/DD/YY service date, logging an error and returning None if invalid."""
+    try:
+        return datetime.strptime(value, "%m/%d/%y").date()
+    except ValueError:
+        _LOGGER.error("Invalid %s: %s. Use MM/DD/YY (e.g. 02/12/26).", field, value)
+        return None
+
+
+def _parse_operation(service: str, data: Mapping[str, Any]) -> tuple[Any, ...] | None:
+    """Return the CycleData arguments for a mutation service's data, or None if invalid."""
+    if service in (SERVICE_LOG_PERIOD_START, SERVICE_LOG_PERIOD_END, SERVICE_LOG_SYMPTOM):
+        day = _parse_service_date(data.get("date", dt_util.now().strftime("%m/%d/%y")), "date")
+        if day is None:
+            return None
+        if service == SERVICE_LOG_SYMPTOM:
+            return day, data["symptom"], data.get("severity", "")
+        return (day,)
+    if service == SERVICE_EDIT_CYCLE:
+        original = _parse_service_date(data["original_start_date"], "original_start_date")
+        if original is None:
+            return None
+        new_start = new_end = None
+        if "new_start_date" in data:
+            new_start = _parse_service_date(data["new_start_date"], "new_start_date")
+            if new_start is None:
+                return None
+        if "new_end_date" in data:
+            new_end = _parse_service_date(data["new_end_date"], "new_end_date")
+            if new_end is None:
+                return None
+        return original, new_start, new_end
+    if service == SERVICE_DELETE_CYCLE:
+        start = _parse_service_date(data["start_date"], "start_date")
+        return None if start is None else (start,)
+    day = _parse_service_date(data["date"], "date")
+    return None if day is None else (day, data["symptom"])
+
+
+async def _async_apply_operation(cd: CycleData, service: str, args: tuple[Any, ...]) -> None:
+    """Apply parsed mutation service arguments to a tracker."""
+    if service == SERVICE_LOG_PERIOD_START:
+        await cd.log_period_start(*args)
+    elif service == SERVICE_LOG_PERIOD_END:
+        await cd.log_period_end(*args)
+    elif service == SERVICE_LOG_SYMPTOM:
+        await cd.log_symptom(*args)
+    elif service == SERVICE_EDIT_CYCLE:
+        if not await cd.edit_cycle(*args):
+            _LOGGER.warning("No cycle found with start date %s.", args[0].isoformat())
+    elif service == SERVICE_DELETE_CYCLE:
+        if not await cd.delete_cycle(*args):
+            _LOGGER.warning("No cycle found with start date %s.", args[0].isoformat())
+    elif not await cd.delete_symptom(*args):
+        _LOGGER.warning("No symptom '%s' found on %s.", args[1], args[0].isoformat())
 
-    async def handle_log_period_end(call: ServiceCall) -> None:
-        cd, eid = _resolve_tracker(hass, call)
+
+def _register_services(hass: HomeAssistant) -> None:
+    """Register domain services (called once when the first entry loads)."""
+
+    async def handle_operation(call: ServiceCall) -> None:
+        cd, _eid = await _async_resolve_tracker(hass, call)
         if cd is None:
             return
-        date_str = call.data.get("date", date.today().strftime("%m/%d/%y"))
-        try:
-            period_date = datetime.strptime(date_str, "%m/%d/%y").date()
-        except ValueError:
-            _LOGGER.error("Invalid date format: %s. Use MM/DD/YY (e.g. 02/12/26).", date_str)
-            return
-        await cd.log_period_end(period_date)
-        async_dispatcher_send(hass, f"{SIGNAL_UPDATE}_{eid}")
+        args = _parse_operation(call.service, call.data)
+        if args is not None:
+            await _async_apply_operation(cd, call.service, args)
 
-    async def handle_log_symptom(call: ServiceCall) -> None:
-        cd, eid = _resolve_tracker(hass, call)
+    async def handle_batch(call: ServiceCall) -> None:
+        cd, _eid = await _async_resolve_tracker(hass, call)
         if cd is None:
             return
-        date_str = call.data.get("date", date.today().strftime("%m/%d/%y"))
-        try:
-            symptom_date = datetime.strptime(date_str, "%m/%d/%y").date()
-        except ValueError:
-            _LOGGER.error("Invalid date format: %s. Use MM/DD/YY (e.g. 02/12/26).", date_str)
-            return
-        await cd.log_symptom(
-            symptom_date,
-            call.data["symptom"],
-            call.data.get("severity", ""),
-        )
-        async_dispatcher_send(hass, f"{SIGNAL_UPDATE}_{eid}")
+        operations: list[tuple[str, tuple[Any, ...]]] = []
+        for index, operation in enumerate(call.data["operations"]):
+            args = _parse_operation(operation["action"], operation)
+            if args is None:
+                _LOGGER.error(
+                    "Batch rejected: operation %d (%s) is invalid.", index + 1, operation["action"]
+                )
+                return
+            operations.append((operation["action"], args))
+        async with cd.async_transaction():
+            for service, args in operations:
+                await _async_apply_operation(cd, service, args)
 
-    async def handle_edit_cycle(call: ServiceCall) -> None:
-        cd, eid = _resolve_tracker(hass, call)
+    async def handle_import_history(call: ServiceCall) -> None:
+        cd, _eid = await _async_resolve_tracker(hass, call)
         if cd is None:
             return
-        try:
-            original = datetime.strptime(call.data["original_start_date"], "%m/%d/%y").date()
-        except ValueError:
+        # Validate every record before touching the history, so a bad row
+        # never leaves a partial import behind.
+        errors: list[str] = []
+        cycles: list[Cycle] = []
+        for index, item in enumerate(call.data["cycles"]):
+            start = _parse_import_date(item["start_date"])
+            end = _parse_import_date(item["end_date"]) if item.get("end_date") else None
+            if start is None:
+                errors.append(f"cycles[{index}]: invalid start_date {item['start_date']!r}")
+            elif item.get("end_date") and end is None:
+                errors.append(f"cycles[{index}]: invalid end_date {item['end_date']!r}")
+            elif end is not None and end < start:
+                errors.append(f"cycles[{index}]: end_date is before start_date")
+            else:
+                cycles.append(Cycle(start, end))
+        symptoms: list[tuple[date, str, str]] = []
+        for index, item in enumerate(call.data["symptoms"]):
+            symptom_date = _parse_import_date(item["date"])
+            if symptom_date is None:
+                errors.append(f"symptoms[{index}]: invalid date {item['date']!r}")
+            elif not item["symptom"].strip():
+                errors.append(f"symptoms[{index}]: empty symptom")
+            else:
+                symptoms.append((symptom_date, item["symptom"], item["severity"]))
+        if errors:
             _LOGGER.error(
-                "Invalid original_start_date: %s. Use MM/DD/YY.", call.data["original_start_date"]
+                "Import rejected, %d invalid record(s). Use MM/DD/YY or YYYY-MM-DD dates: %s",
+                len(errors),
+                "; ".join(errors[:10]),
             )
             return
-        new_start = None
-        new_end = None
-        if "new_start_date" in call.data:
-            try:
-                new_start = datetime.strptime(call.data["new_start_date"], "%m/%d/%y").date()
-            except ValueError:
-                _LOGGER.error("Invalid new_start_date: %s. Use MM/DD/YY.", call.data["new_start_date"])
-                return
-        if "new_end_date" in call.data:
-            try:
-                new_end = datetime.strptime(call.data["new_end_date"], "%m/%d/%y").date()
-            except ValueError:
-                _LOGGER.error("Invalid new_end_date: %s. Use MM/DD/YY.", call.data["new_end_date"])
-                return
-        if not await cd.edit_cycle(original, new_start, new_end):
-            _LOGGER.warning("No cycle found with start date %s.", original.isoformat())
-            return
-        async_dispatcher_send(hass, f"{SIGNAL_UPDATE}_{eid}")
+        added_cycles, added_symptoms = await cd.import_history(cycles, symptoms)
+        _LOGGER.debug(
+            "Imported %d of %d cycles and %d of %d symptoms into %s",
+            added_cycles,
+            len(cycles),
+            added_symptoms,
+            len(symptoms),
+            cd.entry.title,
+        )
 
-    async def handle_delete_cycle(call: ServiceCall) -> None:
-        cd, eid = _resolve_tracker(hass, call)
+    async def handle_get_cycle_summary(call: ServiceCall) -> ServiceResponse:
+        cd, _eid = await _async_resolve_tracker(hass, call)
         if cd is None:
-            return
-        try:
-            start = datetime.strptime(call.data["start_date"], "%m/%d/%y").date()
-        except ValueError:
-            _LOGGER.error("Invalid start_date: %s. Use MM/DD/YY.", call.data["start_date"])
-            return
-        if not await cd.delete_cycle(start):
-            _LOGGER.warning("No cycle found with start date %s.", start.isoformat())
-            return
-        async_dispatcher_send(hass, f"{SIGNAL_UPDATE}_{eid}")
+            raise HomeAssistantError("No tracker matched the service call; see the log.")
+        return cd.summary()
 
-    async def handle_delete_symptom(call: ServiceCall) -> None:
-        cd, eid = _resolve_tracker(hass, call)
+    async def handle_get_predictions(call: ServiceCall) -> ServiceResponse:
+        cd, _eid = await _async_resolve_tracker(hass, call)
         if cd is None:
-            return
+            raise HomeAssistantError("No tracker matched the service call; see the log.")
+        return {"predictions": cd.predictions(call.data["count"])}
+
+    async def handle_search_symptoms(call: ServiceCall) -> ServiceResponse:
+        cd, _eid = await _async_resolve_tracker(hass, call)
+        if cd is None:
+            raise HomeAssistantError("No tracker matched the service call; see the log.")
+        bounds: dict[str, date | None] = {"start_date": None, "end_date": None}
+        for field in bounds:
+            if field in call.data:
+                bounds[field] = _parse_service_date(call.data[field], field)
+                if bounds[field] is None:
+                    raise ServiceValidationError(f"Invalid {field}; use MM/DD/YY.")
+        return await cd.async_search_symptoms(
+            call.data.get("symptom"),
+            call.data.get("severity"),
+            bounds["start_date"],
+            bounds["end_date"],
+            call.data["limit"],
+            call.data.get("cursor"),
+        )
+
+    async def handle_export_history(call: ServiceCall) -> ServiceResponse:
+        if call.data.get("tracker", "").strip():
+            cd, _eid = await _async_resolve_tracker(hass, call)
+            if cd is None:
+                raise HomeAssistantError("No tracker matched the service call; see the log.")
+            trackers = [cd]
+            label = cd.entry.data.get("name", cd.entry.title)
+        else:
+            # Without a tracker every loaded tracker goes into one file.
+            trackers = []
+            for cd in list(hass.data[DOMAIN].values()):
+                if await cd.async_wait_loaded():
+                    trackers.append(cd)
+                else:
+                    _LOGGER.warning(
+                        "Skipping tracker '%s' in export; it failed to load", cd.entry.title
+                    )
+            label = "all"
+        fmt = call.data["format"]
+        path = hass.config.path(
+            EXPORT_DIRECTORY,
+            f"{slugify(label)}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.{fmt}",
+        )
+        sources = [await cd.async_export_source() for cd in trackers]
         try:
-            symptom_date = datetime.strptime(call.data["date"], "%m/%d/%y").date()
-        except ValueError:
-            _LOGGER.error("Invalid date: %s. Use MM/DD/YY.", call.data["date"])
-            return
-        if not await cd.delete_symptom(symptom_date, call.data["symptom"]):
-            _LOGGER.warning(
-                "No symptom '%s' found on %s.", call.data["symptom"], symptom_date.isoformat()
+            path, cycles, symptoms = await hass.async_add_executor_job(
+                write_export, path, fmt, sources
             )
-            return
-        async_dispatcher_send(hass, f"{SIGNAL_UPDATE}_{eid}")
+        except OSError as err:
+            raise HomeAssistantError(f"Could not write {path}: {err}") from err
+        _LOGGER.info(
+            "Exported %d cycles and %d symptoms from %d tracker(s) to %s",
+            cycles,
+            symptoms,
+            len(sources),
+            path,
+        )
+        return {"path": path, "trackers": len(sources), "cycles": cycles, "symptoms": symptoms}
 
+    for service, schema in _OPERATION_SCHEMAS.items():
+        hass.services.async_register(DOMAIN, service, handle_operation, schema=schema)
+    hass.services.async_register(DOMAIN, SERVICE_BATCH, handle_batch, schema=SERVICE_BATCH_SCHEMA)
     hass.services.async_register(
-        DOMAIN, SERVICE_LOG_PERIOD_START, handle_log_period_start, schema=SERVICE_LOG_PERIOD_SCHEMA
+        DOMAIN,
+        SERVICE_GET_CYCLE_SUMMARY,
+        handle_get_cycle_summary,
+        schema=SERVICE_GET_CYCLE_SUMMARY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_LOG_PERIOD_END, handle_log_period_end, schema=SERVICE_LOG_PERIOD_SCHEMA
+        DOMAIN,
+        SERVICE_GET_PREDICTIONS,
+        handle_get_predictions,
+        schema=SERVICE_GET_PREDICTIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_LOG_SYMPTOM, handle_log_symptom, schema=SERVICE_LOG_SYMPTOM_SCHEMA
+        DOMAIN,
+        SERVICE_SEARCH_SYMPTOMS,
+        handle_search_symptoms,
+        schema=SERVICE_SEARCH_SYMPTOMS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_EDIT_CYCLE, handle_edit_cycle, schema=SERVICE_EDIT_CYCLE_SCHEMA
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        handle_export_history,
+        schema=SERVICE_EXPORT_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_DELETE_CYCLE, handle_delete_cycle, schema=SERVICE_DELETE_CYCLE_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_DELETE_SYMPTOM, handle_delete_symptom, schema=SERVICE_DELETE_SYMPTOM_SCHEMA
+        DOMAIN, SERVICE_IMPORT_HISTORY, handle_import_history, schema=SERVICE_IMPORT_HISTORY_SCHEMA
     )
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove a deleted tracker's long-term statistics."""
+    if statistics_enabled(hass):
+        async_clear_statistics(hass, entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-        # Only remove services when the last tracker is unloaded.
+        cycle_data: CycleData = hass.data[DOMAIN].pop(entry.entry_id)
+        _rebuild_tracker_index(hass)
+        await cycle_data.async_flush()
+        # Only remove services and the midnight timer when the last tracker is unloaded.
         if not hass.data[DOMAIN]:
+            hass.data.pop(DATA_DAY_ROLLOVER)()
             for service in [
                 SERVICE_LOG_PERIOD_START, SERVICE_LOG_PERIOD_END, SERVICE_LOG_SYMPTOM,
                 SERVICE_EDIT_CYCLE, SERVICE_DELETE_CYCLE, SERVICE_DELETE_SYMPTOM,
+                SERVICE_IMPORT_HISTORY, SERVICE_BATCH, SERVICE_GET_CYCLE_SUMMARY,
+                SERVICE_GET_PREDICTIONS, SERVICE_SEARCH_SYMPTOMS, SERVICE_EXPORT_HISTORY,
             ]:
                 hass.services.async_remove(DOMAIN, service)
     return unload_ok
 
 
+class _Transition(NamedTuple):
+    """A predicted transition and the bus event announcing it."""
+
+    when: datetime
+    event_type: str
+    data: dict[str, Any]
+
+
+def _isoformat(value: date | None) -> str | None:
+    """Return a date as an ISO string for service responses."""
+    return value.isoformat() if value else None
+
+
 class CycleData:
     """Class to manage cycle data storage and calculations."""
 
@@ -288,190 +643,1047 @@ class CycleData:
         """Initialize cycle data."""
         self.hass = hass
         self.entry = entry
-        self._store = Store(
+        self._store = CycleStore(
             hass,
             STORAGE_VERSION,
             f"{DOMAIN}.cycles.{entry.entry_id}",
         )
-        self.cycles: list[dict[str, str]] = []
-        self.symptoms: list[dict[str, str]] = []
+        self._journal = CycleJournal(hass, entry.entry_id)
+        # Sequence number of the last journaled mutation.
+        self._journal_seq = 0
+        self._journal_flush_unsub: CALLBACK_TYPE | None = None
+        self._archive = CycleArchive(hass, entry.entry_id)
+        # Day ordinal before which history may live in the archive (0 = none).
+        self._archived_before = 0
+        # Held while rows move into the archive or statistics read all history.
+        self._archive_lock = asyncio.Lock()
+        # True once every completed cycle has been published to the recorder.
+        self._statistics_backfilled = False
+        # Earliest day whose statistics rows pending mutations changed beyond
+        # what their records show; 0 when every row must be rebuilt.
+        self._statistics_from = date.max.toordinal()
+        self.cycles = CycleHistory()
+        self.symptoms = SymptomLog()
+        self._save_pending = False
+        # Held by the task mutating the history, for a whole transaction if
+        # one is open, so other tasks' changes neither join nor interleave.
+        self._mutation_lock = asyncio.Lock()
+        self._mutation_owner: asyncio.Task[Any] | None = None
+        # Mutation records held by the open transaction, if any.
+        self._transaction: list[list[Any]] | None = None
+        self.loaded = False
+        self._load_done = asyncio.Event()
+        # Bumped on every mutation; derived state is cached per (version, day).
+        self.version = 0
+        # Distinguishes this instance's versions from those before a restart or reload.
+        self.load_token = uuid4().hex
+        self._snapshot: CycleSnapshot | None = None
+        # Upcoming transitions, soonest first; a timer is armed for the head.
+        self._transitions: deque[_Transition] = deque()
+        self._transition_unsub: CALLBACK_TYPE | None = None
+
+    @property
+    def _save_delay(self) -> int:
+        """Return the configured write-behind delay in seconds."""
+        return self.entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+
+    @property
+    def _archive_months(self) -> int:
+        """Return the retention window in months (0 disables archiving)."""
+        return self.entry.options.get(CONF_ARCHIVE_MONTHS, DEFAULT_ARCHIVE_MONTHS)
+
+    @property
+    def _journal_mode(self) -> bool:
+        """Return True if mutations are appended to the journal."""
+        return self.entry.options.get(CONF_STORAGE_MODE) == STORAGE_MODE_JOURNAL
+
+    async def async_wait_loaded(self) -> bool:
+        """Wait for the initial load; return False if it failed."""
+        await self._load_done.wait()
+        return self.loaded
 
     async def async_load(self) -> None:
-        """Load data from storage."""
+        """Load the tracker and notify its entities once it is ready."""
+        started = time.monotonic()
+        try:
+            await self._async_load()
+        except Exception:
+            _LOGGER.exception("Error loading tracker %s", self.entry.title)
+            return
+        finally:
+            self._load_done.set()
+        self.loaded = True
+        self.version += 1
+        _LOGGER.debug(
+            "Loaded tracker %s in %.3f s (%d cycles, %d symptoms)",
+            self.entry.title,
+            time.monotonic() - started,
+            len(self.cycles),
+            len(self.symptoms),
+        )
+        async_dispatcher_send(self.hass, f"{SIGNAL_UPDATE}_{self.entry.entry_id}")
+        self._async_schedule_transitions()
+        if not self._statistics_backfilled:
+            self._async_schedule_statistics_rebuild()
+
+    async def _async_load(self) -> None:
+        """Load data from storage, replaying any journaled mutations."""
         stored = await self._store.async_load()
         if stored:
-            self.cycles = stored.get("cycles", [])
-            self.symptoms = stored.get("symptoms", [])
+            self.cycles = CycleHistory.from_columns(stored.get("cycles", {}))
+            self.symptoms = SymptomLog.from_columns(stored.get("symptoms", {}))
+            self._journal_seq = stored.get("journal_seq", 0)
+            self._archived_before = stored.get("archived_before") or 0
+            self._statistics_backfilled = stored.get("statistics_backfilled", False)
         else:
             # Load initial cycles from config entry data
             initial_cycles = self.entry.data.get("initial_cycles", [])
-            self.cycles = initial_cycles
+            self.cycles = CycleHistory.from_storage(initial_cycles)
             await self._async_save()
 
+        # The journal is replayed whatever the current mode, so switching back
+        # to single-file storage never drops mutations still in the journal.
+        records = await self._journal.async_read()
+        for seq, op, *args in records:
+            if seq > self._journal_seq:
+                self._replay(op, args)
+                self._journal_seq = seq
+        if records:
+            await self.async_compact()
+            self._statistics_from = date.max.toordinal()
+            if self._has_unfiled_rows():
+                await self.async_archive(self._archived_before)
+
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+            )
+        )
+        self.entry.async_on_unload(self._async_cancel_transitions)
+        if self._journal_mode:
+            self.entry.async_on_unload(
+                async_track_time_interval(
+                    self.hass, self._async_scheduled_compact, JOURNAL_COMPACT_INTERVAL
+                )
+            )
+        if self._archive_months:
+            await self.async_archive()
+            self.entry.async_on_unload(
+                async_track_time_interval(
+                    self.hass, self._async_scheduled_archive, ARCHIVE_INTERVAL
+                )
+            )
+
+    @callback
+    def async_refresh_day(self) -> None:
+        """Notify entities after the date changed.
+
+        The snapshot is keyed on the date, so the first entity to read it
+        recomputes it once and the rest reuse it; entities whose values did
+        not change skip their state write.
+        """
+        if self.loaded:
+            async_dispatcher_send(self.hass, f"{SIGNAL_UPDATE}_{self.entry.entry_id}")
+
     async def _async_save(self) -> None:
-        """Save data to storage."""
-        await self._store.async_save(
-            {"cycles": self.cycles, "symptoms": self.symptoms}
+        """Save data to storage.
+
+        With a non-zero save delay the write is deferred and coalesced with any
+        other change made before it fires; the Store flushes pending writes
+        when Home Assistant stops, and async_flush covers unloading the entry.
+        """
+        self._save_pending = True
+        if self._save_delay:
+            self._store.async_delay_save(self._data_to_save, self._save_delay)
+        else:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_flush(self) -> None:
+        """Write pending delayed saves and journal records immediately."""
+        if self._journal_flush_unsub is not None:
+            self._journal_flush_unsub()
+            self._journal_flush_unsub = None
+        await self._journal.async_flush()
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_compact(self) -> None:
+        """Fold the journal into a fresh Store snapshot and truncate it."""
+
+        async def save_snapshot() -> None:
+            await self._store.async_save(self._data_to_save())
+
+        await self._journal.async_compact(save_snapshot)
+
+    async def async_archive(self, cutoff: int | None = None) -> None:
+        """Move history older than the retention window into per-year segments.
+
+        Segments are written before the main store drops the moved rows, and
+        a segment rewrite keeps only rows from before the previous horizon, so
+        an interrupted pass never loses or duplicates history. The newest few
+        cycles always stay in memory for the rolling averages.
+
+        Passing the current horizon as ``cutoff`` files rows that were added
+        behind it (back-dated or imported) without moving the horizon.
+        """
+        async with self._async_exclusive(), self._archive_lock:
+            await self._async_archive(cutoff)
+
+    async def _async_archive(self, cutoff: int | None) -> None:
+        """Run an archive pass; the caller holds the archive lock."""
+        if cutoff is None:
+            today = dt_util.now().date()
+            months = today.year * 12 + today.month - 1 - self._archive_months
+            cutoff = date(months // 12, months % 12 + 1, 1).toordinal()
+            if cutoff <= self._archived_before:
+                return
+        previous = (
+            date.fromordinal(self._archived_before).isoformat() if self._archived_before else ""
         )
 
+        segments: dict[int, dict[str, list[dict[str, str]]]] = {}
+        for cycle in self.cycles.pop_before(cutoff, keep=STATS_WINDOW + 1):
+            year = int(cycle["start_date"][:4])
+            segments.setdefault(year, {"cycles": [], "symptoms": []})["cycles"].append(cycle)
+        for symptom in self.symptoms.pop_before(cutoff):
+            year = int(symptom["date"][:4])
+            segments.setdefault(year, {"cycles": [], "symptoms": []})["symptoms"].append(symptom)
+
+        for year, moved in segments.items():
+            existing = await self._archive.async_read_raw(year)
+            # Cycles are unique by start date; symptoms are not, so only those
+            # archived by an earlier, completed pass are carried over. Rows
+            # filed behind an unchanged horizon are checked against those.
+            cycles = {c["start_date"]: c for c in existing.get("cycles", [])}
+            cycles.update((c["start_date"], c) for c in moved["cycles"])
+            symptoms = [s for s in existing.get("symptoms", []) if s["date"] < previous]
+            kept = {(s["date"], s["symptom"]) for s in symptoms}
+            symptoms += [s for s in moved["symptoms"] if (s["date"], s["symptom"]) not in kept]
+            await self._archive.async_write(
+                year,
+                {
+                    "cycles": sorted(cycles.values(), key=lambda c: c["start_date"]),
+                    "symptoms": symptoms,
+                },
+            )
+
+        self._archived_before = cutoff
+        self.version += 1
+        await self.async_compact()
+        if segments:
+            _LOGGER.debug(
+                "Archived history before %s into years %s",
+                date.fromordinal(cutoff).isoformat(),
+                sorted(segments),
+            )
+
+    async def async_archived_cycles(self, start: date, end: date) -> list[Cycle]:
+        """Return archived cycles overlapping [start, end).
+
+        Only segments for those years are read, and only when the range reaches
+        back past the archive horizon.
+        """
+        if not self._archived_before or start.toordinal() >= self._archived_before:
+            return []
+        # A period logged late in December can overlap the start of January.
+        first_year = (start - timedelta(days=31)).year
+        last_year = min(end, date.fromordinal(self._archived_before)).year
+        cycles: list[Cycle] = []
+        for year in range(first_year, last_year + 1):
+            history, _symptoms = await self._archive.async_get_year(year)
+            cycles.extend(history.overlapping(start.toordinal(), end.toordinal()))
+        return cycles
+
+    async def async_history_start(self) -> date | None:
+        """Return the earliest day the history may cover, archive included.
+
+        With an archive this is January 1st of its oldest year.
+        """
+        if self._archived_before:
+            if years := await self._archive.async_years():
+                return date(years[0], 1, 1)
+        return self.cycles[0].start if self.cycles else None
+
+    @callback
+    def _async_update_statistics(self, records: list[list[Any]], first_day: int) -> None:
+        """Republish the statistics rows that mutations may have changed.
+
+        Logging a new period or a symptom only changes the cycle it falls in
+        and the one before it, so those rows and any later ones are rewritten
+        in place; ``first_day`` moves that back to cycles changed elsewhere.
+        Edits, deletes, imports and a logged start that moved an open cycle
+        can move or drop cycle starts and would leave stale rows behind, so
+        they rebuild every row.
+        """
+        if not statistics_enabled(self.hass):
+            return
+        if not first_day:
+            self._async_schedule_statistics_rebuild()
+            return
+        for op, *args in records:
+            if op not in ("log_period_start", "log_period_end", "log_symptom", "delete_symptom"):
+                self._async_schedule_statistics_rebuild()
+                return
+            first_day = min(first_day, date.fromisoformat(args[0]).toordinal())
+        # The cycle running the day before; a new start there changes its length.
+        first = bisect_right(self.cycles.starts, first_day - 1) - 1
+        if first < 0 and self._archived_before:
+            # The last archived cycle's length depends on the oldest one in memory.
+            self._async_schedule_statistics_rebuild()
+            return
+        async_publish_statistics(
+            self.hass,
+            self.entry.entry_id,
+            self.entry.data.get("name", self.entry.title),
+            cycle_statistics(
+                self.cycles.starts, self.cycles.ends, self.symptoms.dates, max(first, 0)
+            ),
+        )
+
+    @callback
+    def _async_schedule_statistics_rebuild(self) -> None:
+        """Rebuild the tracker's statistics in the background."""
+        if statistics_enabled(self.hass):
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_rebuild_statistics(),
+                f"{DOMAIN} statistics {self.entry.title}",
+            )
+
+    async def _async_rebuild_statistics(self) -> None:
+        """Replace the tracker's statistics with rows for every completed cycle.
+
+        Archived years are included. The first run is the one-time backfill
+        of existing history; afterwards rows are updated as cycles change.
+        """
+        starts: list[int] = []
+        ends: list[int] = []
+        symptom_days: list[int] = []
+        async with self._archive_lock:
+            if self._archived_before:
+                for year in await self._archive.async_years():
+                    history, log = await self._archive.async_get_year(year)
+                    starts.extend(history.starts)
+                    ends.extend(history.ends)
+                    symptom_days.extend(log.dates)
+            starts.extend(self.cycles.starts)
+            ends.extend(self.cycles.ends)
+            symptom_days.extend(self.symptoms.dates)
+        symptom_days.sort()
+        async_clear_statistics(self.hass, self.entry.entry_id)
+        async_publish_statistics(
+            self.hass,
+            self.entry.entry_id,
+            self.entry.data.get("name", self.entry.title),
+            cycle_statistics(starts, ends, symptom_days),
+        )
+        if not self._statistics_backfilled:
+            self._statistics_backfilled = True
+            await self._async_save()
+            _LOGGER.debug(
+                "Published statistics for %d completed cycles of %s",
+                max(len(starts) - 1, 0),
+                self.entry.title,
+            )
+
+    async def _async_scheduled_archive(self, _now: datetime) -> None:
+        """Run the daily archive pass."""
+        await self.async_archive()
+
+    async def _async_final_write(self, _event: Event) -> None:
+        """Flush pending writes when Home Assistant shuts down."""
+        await self.async_flush()
+
+    async def _async_scheduled_compact(self, _now: datetime) -> None:
+        """Compact the journal on the periodic timer if it has records."""
+        if self._journal.size or self._journal.pending:
+            await self.async_compact()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store; called when the write actually happens."""
+        self._save_pending = False
+        return {
+            "cycles": self.cycles.as_columns(),
+            "symptoms": self.symptoms.as_columns(),
+            "journal_seq": self._journal_seq,
+            "archived_before": self._archived_before or None,
+            "statistics_backfilled": self._statistics_backfilled,
+        }
+
+    @asynccontextmanager
+    async def async_transaction(self) -> AsyncIterator[None]:
+        """Group the mutations made inside the block into one commit.
+
+        They are persisted together with a single version bump and update
+        signal when the block exits. If it raises, the history is restored
+        to its state on entry and nothing is written. A transaction opened
+        inside another one in the same task joins it; mutations from other
+        tasks wait until the block exits.
+        """
+        async with self._async_exclusive():
+            if self._transaction is not None:
+                yield
+                return
+            cycles, symptoms = self.cycles.copy(), self.symptoms.copy()
+            statistics_from = self._statistics_from
+            self._transaction = []
+            try:
+                yield
+            except BaseException:
+                self.cycles, self.symptoms = cycles, symptoms
+                self._statistics_from = statistics_from
+                # Entities may have cached state derived from the discarded changes.
+                self.version += 1
+                raise
+            finally:
+                records, self._transaction = self._transaction, None
+            if records:
+                await self._async_persist(records)
+
+    @asynccontextmanager
+    async def _async_exclusive(self) -> AsyncIterator[None]:
+        """Hold the mutation lock for the block, unless this task already does."""
+        task = asyncio.current_task()
+        if self._mutation_owner is task:
+            yield
+            return
+        async with self._mutation_lock:
+            self._mutation_owner = task
+            try:
+                yield
+            finally:
+                self._mutation_owner = None
+
+    async def _async_commit(self, op: str, *args: Any) -> None:
+        """Persist a mutation, or hold it for the open transaction."""
+        record = [op, *(arg.isoformat() if isinstance(arg, date) else arg for arg in args)]
+        if self._transaction is not None:
+            self._transaction.append(record)
+        else:
+            await self._async_persist([record])
+
+    async def _async_persist(self, records: list[list[Any]]) -> None:
+        """Invalidate derived state after mutations, persist them and notify entities.
+
+        In journal mode only a small ``[seq, op, *args]`` record is written,
+        with a transaction's mutations nested in one ``transaction`` record so
+        replay applies all or none of them; otherwise the whole document is
+        saved.
+        """
+        self.version += 1
+        self._journal_seq += 1
+        statistics_from, self._statistics_from = self._statistics_from, date.max.toordinal()
+        if self._statistics_backfilled:
+            self._async_update_statistics(records, statistics_from)
+        if not self._journal_mode:
+            await self._async_save()
+        else:
+            record = records[0] if len(records) == 1 else ["transaction", records]
+            self._journal.append([self._journal_seq, *record])
+            if self._journal.size >= JOURNAL_MAX_RECORDS:
+                await self.async_compact()
+            elif not self._save_delay:
+                await self._journal.async_flush()
+            elif self._journal_flush_unsub is None:
+                self._journal_flush_unsub = async_call_later(
+                    self.hass, self._save_delay, self._async_delayed_journal_flush
+                )
+        # Rows logged or imported behind the archive horizon belong in its
+        # segments, where searches and archived calendar ranges look for them.
+        if self._has_unfiled_rows():
+            await self.async_archive(self._archived_before)
+        async_dispatcher_send(self.hass, f"{SIGNAL_UPDATE}_{self.entry.entry_id}")
+        self._async_schedule_transitions()
+
+    def _has_unfiled_rows(self) -> bool:
+        """Return True if memory holds rows an archive pass at the horizon would move."""
+        horizon = self._archived_before
+        if not horizon:
+            return False
+        if self.symptoms.dates and self.symptoms.dates[0] < horizon:
+            return True
+        starts = self.cycles.starts
+        return len(starts) > STATS_WINDOW + 1 and starts[0] < horizon
+
+    async def _async_delayed_journal_flush(self, _now: datetime) -> None:
+        """Write journal records buffered during the save delay."""
+        self._journal_flush_unsub = None
+        await self._journal.async_flush()
+
+    def _replay(self, op: str, args: list[Any]) -> None:
+        """Re-apply a journaled mutation."""
+        match op, args:
+            case "log_period_start", [day]:
+                self._log_period_start(date.fromisoformat(day))
+            case "log_period_end", [day]:
+                self._log_period_end(date.fromisoformat(day))
+            case "log_symptom", [day, symptom, severity]:
+                self._log_symptom(date.fromisoformat(day), symptom, severity)
+            case "edit_cycle", [original, new_start, new_end]:
+                self._edit_cycle(
+                    date.fromisoformat(original),
+                    date.fromisoformat(new_start) if new_start else None,
+                    date.fromisoformat(new_end) if new_end else None,
+                )
+            case "delete_cycle", [start]:
+                self._delete_cycle(date.fromisoformat(start))
+            case "delete_symptom", [day, symptom]:
+                self._delete_symptom(date.fromisoformat(day), symptom)
+            case "import_history", [cycles, symptoms]:
+                self._import_history(
+                    [
+                        Cycle(date.fromisoformat(start), date.fromisoformat(end) if end else None)
+                        for start, end in cycles
+                    ],
+                    [
+                        (date.fromisoformat(day), symptom, severity)
+                        for day, symptom, severity in symptoms
+                    ],
+                )
+            case "transaction", [records]:
+                for nested_op, *nested_args in records:
+                    self._replay(nested_op, nested_args)
+            case _:
+                _LOGGER.warning("Ignoring unknown journal record: %s %s", op, args)
+
     async def log_period_start(self, period_date: date) -> None:
         """Log the start of a period."""
-        date_str = period_date.isoformat()
-        # Check if we already have an open cycle (start without end)
-        for cycle in reversed(self.cycles):
-            if cycle.get("start_date") == date_str:
-                return  # Already logged
-            if not cycle.get("end_date"):
-                cycle["start_date"] = date_str
-                await self._async_save()
-                return
-        # Add new cycle
-        self.cycles.append({"start_date": date_str, "end_date": ""})
-        await self._async_save()
+        async with self._async_exclusive():
+            if await self._async_is_archived(period_date):
+                return  # Already logged in an archived year
+            if self._log_period_start(period_date):
+                await self._async_commit("log_period_start", period_date)
+
+    def _log_period_start(self, period_date: date) -> bool:
+        """Apply log_period_start; return True if anything changed."""
+        if self.cycles.find(period_date) >= 0:
+            return False  # Already logged
+        # If a period is already open (start without end), move its start
+        open_index = self.cycles.newest_open()
+        if open_index >= 0:
+            self.cycles.set_start(open_index, period_date)
+            # Rows dated on the old start would outlive the move.
+            self._statistics_from = 0
+        else:
+            self.cycles.insert(period_date)
+        return True
 
     async def log_period_end(self, period_date: date) -> None:
         """Log the end of a period."""
-        date_str = period_date.isoformat()
-        for cycle in reversed(self.cycles):
-            if not cycle.get("end_date"):
-                cycle["end_date"] = date_str
-                await self._async_save()
+        async with self._async_exclusive():
+            if self._log_period_end(period_date):
+                await self._async_commit("log_period_end", period_date)
                 return
         _LOGGER.warning("No open period found to close. Log period start first.")
 
+    def _log_period_end(self, period_date: date) -> bool:
+        """Apply log_period_end; return True if an open period was closed."""
+        open_index = self.cycles.newest_open()
+        if open_index < 0:
+            return False
+        # The closed cycle may start well before the end date; its row changes.
+        self._statistics_from = min(self._statistics_from, self.cycles.starts[open_index] + 1)
+        self.cycles.set_end(open_index, period_date)
+        return True
+
     async def log_symptom(self, symptom_date: date, symptom: str, severity: str) -> None:
         """Log a symptom."""
-        self.symptoms.append(
-            {
-                "date": symptom_date.isoformat(),
-                "symptom": symptom,
-                "severity": severity,
-            }
-        )
-        await self._async_save()
+        async with self._async_exclusive():
+            self._log_symptom(symptom_date, symptom, severity)
+            await self._async_commit("log_symptom", symptom_date, symptom, severity)
+
+    def _log_symptom(self, symptom_date: date, symptom: str, severity: str) -> None:
+        """Apply log_symptom."""
+        self.symptoms.add(symptom_date, symptom, severity)
 
     async def edit_cycle(
         self, original_start: date, new_start: date | None, new_end: date | None
     ) -> bool:
         """Edit an existing cycle identified by its original start date.
 
-        Returns True if the cycle was found and updated.
+        Returns True if the cycle was found and updated. Raises
+        ServiceValidationError if the cycle has been archived.
         """
-        target = original_start.isoformat()
-        for cycle in self.cycles:
-            if cycle.get("start_date") == target:
-                if new_start is not None:
-                    cycle["start_date"] = new_start.isoformat()
-                if new_end is not None:
-                    cycle["end_date"] = new_end.isoformat()
-                await self._async_save()
-                return True
-        return False
+        async with self._async_exclusive():
+            if not self._edit_cycle(original_start, new_start, new_end):
+                await self._async_raise_if_archived(original_start)
+                return False
+            await self._async_commit("edit_cycle", original_start, new_start, new_end)
+        return True
+
+    def _edit_cycle(
+        self, original_start: date, new_start: date | None, new_end: date | None
+    ) -> bool:
+        """Apply edit_cycle; return True if the cycle was found."""
+        index = self.cycles.find(original_start)
+        if index < 0:
+            return False
+        if new_start is not None:
+            index = self.cycles.set_start(index, new_start)
+        if new_end is not None:
+            self.cycles.set_end(index, new_end)
+        return True
 
     async def delete_cycle(self, start: date) -> bool:
         """Delete a cycle identified by its start date.
 
-        Returns True if the cycle was found and removed.
+        Returns True if the cycle was found and removed. Raises
+        ServiceValidationError if the cycle has been archived.
         """
-        target = start.isoformat()
-        for i, cycle in enumerate(self.cycles):
-            if cycle.get("start_date") == target:
-                self.cycles.pop(i)
-                await self._async_save()
-                return True
-        return False
+        async with self._async_exclusive():
+            if not self._delete_cycle(start):
+                await self._async_raise_if_archived(start)
+                return False
+            await self._async_commit("delete_cycle", start)
+        return True
+
+    async def _async_is_archived(self, start: date) -> bool:
+        """Return True if a cycle starting on ``start`` is in the archive."""
+        if start.toordinal() >= self._archived_before:
+            return False
+        history, _symptoms = await self._archive.async_get_year(start.year)
+        return history.find(start) >= 0
+
+    async def _async_raise_if_archived(self, start: date) -> None:
+        """Raise if the cycle starting on ``start`` has moved to the archive."""
+        if await self._async_is_archived(start):
+            raise ServiceValidationError(
+                f"The cycle starting {start.isoformat()} is archived and can no longer be "
+                "edited or deleted."
+            )
+
+    def _delete_cycle(self, start: date) -> bool:
+        """Apply delete_cycle; return True if the cycle was found."""
+        index = self.cycles.find(start)
+        if index < 0:
+            return False
+        self.cycles.pop(index)
+        return True
 
     async def delete_symptom(self, symptom_date: date, symptom: str) -> bool:
         """Delete a symptom matching the date and name.
 
         Removes the first matching entry. Returns True if found.
         """
-        target_date = symptom_date.isoformat()
-        for i, s in enumerate(self.symptoms):
-            if s.get("date") == target_date and s.get("symptom") == symptom:
-                self.symptoms.pop(i)
-                await self._async_save()
-                return True
-        return False
+        async with self._async_exclusive():
+            if not self._delete_symptom(symptom_date, symptom):
+                return False
+            await self._async_commit("delete_symptom", symptom_date, symptom)
+        return True
+
+    def _delete_symptom(self, symptom_date: date, symptom: str) -> bool:
+        """Apply delete_symptom; return True if the symptom was found."""
+        return self.symptoms.remove(symptom_date, symptom)
+
+    async def import_history(
+        self, cycles: list[Cycle], symptoms: list[tuple[date, str, str]]
+    ) -> tuple[int, int]:
+        """Merge imported cycles and symptoms as a single change.
+
+        Rows already logged, in memory or in the archive, are skipped.
+        Returns the number of cycles and symptoms that were added.
+        """
+        async with self._async_exclusive():
+            if self._archived_before:
+                cycles, symptoms = await self._async_skip_archived(cycles, symptoms)
+            added = self._import_history(cycles, symptoms)
+            if any(added):
+                await self._async_commit(
+                    "import_history",
+                    [[c.start.isoformat(), c.end.isoformat() if c.end else None] for c in cycles],
+                    [[day.isoformat(), symptom, severity] for day, symptom, severity in symptoms],
+                )
+        return added
+
+    def _import_history(
+        self, cycles: list[Cycle], symptoms: list[tuple[date, str, str]]
+    ) -> tuple[int, int]:
+        """Apply import_history; return the number of cycles and symptoms added."""
+        return (
+            self.cycles.merge(
+                (c.start.toordinal(), c.end.toordinal() if c.end else OPEN_END) for c in cycles
+            ),
+            self.symptoms.merge(
+                (day.toordinal(), symptom, severity) for day, symptom, severity in symptoms
+            ),
+        )
+
+    async def _async_skip_archived(
+        self, cycles: list[Cycle], symptoms: list[tuple[date, str, str]]
+    ) -> tuple[list[Cycle], list[tuple[date, str, str]]]:
+        """Drop imported rows already present in the archived years they fall in."""
+        horizon = self._archived_before
+        years = {c.start.year for c in cycles if c.start.toordinal() < horizon}
+        years.update(day.year for day, _, _ in symptoms if day.toordinal() < horizon)
+        archived_starts: set[int] = set()
+        archived_symptoms: set[tuple[str, str]] = set()
+        for year in years:
+            history, log = await self._archive.async_get_year(year)
+            archived_starts.update(history.starts)
+            archived_symptoms.update((row["date"], row["symptom"]) for row in log)
+        return (
+            [c for c in cycles if c.start.toordinal() not in archived_starts],
+            [
+                row
+                for row in symptoms
+                if (row[0].isoformat(), row[1]) not in archived_symptoms
+            ],
+        )
 
     @property
-    def completed_cycles(self) -> list[dict[str, str]]:
-        """Return only cycles with both start and end dates."""
-        return [c for c in self.cycles if c.get("start_date") and c.get("end_date")]
+    def snapshot(self) -> CycleSnapshot:
+        """Return today's derived state, recomputed only after a mutation or date change."""
+        today = dt_util.now().date()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self.version or snapshot.today != today:
+            snapshot = self._snapshot = self._compute_snapshot(today)
+        return snapshot
+
+    def _compute_average_cycle_length(self) -> int:
+        """Calculate average cycle length from last 3 cycle intervals.
+
+        Uses all cycles with a start date (not just completed ones) because
+        cycle length is the interval between consecutive start dates and does
+        not require an end date.
+        """
+        total, count = self.cycles.interval_window()
+        if not count:
+            return DEFAULT_CYCLE_LENGTH
+        return round(total / count)
+
+    def _compute_average_period_length(self) -> int:
+        """Calculate average period length from last 3 completed cycles."""
+        total, count = self.cycles.length_window()
+        if not count:
+            return DEFAULT_PERIOD_LENGTH
+        return round(total / count)
+
+    def _compute_snapshot(self, today: date) -> CycleSnapshot:
+        """Compute every date-dependent value for ``today`` in a single pass."""
+        cycles = self.cycles
+        cycle_len = self._compute_average_cycle_length()
+        period_len = self._compute_average_period_length()
+
+        start = date.fromordinal(cycles.starts[-1]) if cycles else None
+        end = None
+        ends = cycles.ends
+        for i in range(len(ends) - 1, -1, -1):
+            if ends[i] != OPEN_END:
+                end = date.fromordinal(ends[i])
+                break
+        is_active = bool(cycles) and ends[-1] == OPEN_END
+
+        cycle_day = None
+        next_period = None
+        days_until = None
+        phase = PHASE_UNKNOWN
+        if start is not None:
+            cycle_day = ((today - start).days % cycle_len) + 1
+            # The current cycle's expected start: the latest whole number of
+            # cycles after the last start that is not past today, at least one.
+            cycles_since = max((today - start).days // cycle_len, 1)
+            next_period = start + timedelta(days=cycles_since * cycle_len)
+            days_until = (next_period - today).days
+
+            ovulation_day = cycle_len - 14
+            if cycle_day <= period_len:
+                phase = PHASE_MENSTRUAL
+            elif cycle_day < ovulation_day - 1:
+                phase = PHASE_FOLLICULAR
+            elif cycle_day <= ovulation_day + 2:
+                phase = PHASE_OVULATION
+            else:
+                phase = PHASE_LUTEAL
+
+        days_overdue = -1
+        if not is_active and next_period is not None:
+            delta = (today - next_period).days
+            days_overdue = delta if delta >= 0 else -1
+
+        days_period_end_overdue = -1
+        if is_active and start is not None:
+            days_period_end_overdue = (today - start).days + 1 - period_len
+
+        return CycleSnapshot(
+            version=self.version,
+            today=today,
+            average_cycle_length=cycle_len,
+            average_period_length=period_len,
+            last_period_start=start,
+            last_period_end=end,
+            is_period_active=is_active,
+            current_cycle_day=cycle_day,
+            next_period_date=next_period,
+            days_until_next_period=days_until,
+            current_phase=phase,
+            is_fertile_window=phase == PHASE_OVULATION,
+            is_pms_window=days_until is not None and 0 <= days_until <= 5,
+            days_overdue=days_overdue,
+            days_period_end_overdue=days_period_end_overdue,
+            days_left_of_period=(
+                -days_period_end_overdue if days_period_end_overdue < 0 else None
+            ),
+            symptoms_today=tuple(self.symptoms.on(today)),
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Return today's derived values and history statistics for get_cycle_summary."""
+        snapshot = self.snapshot
+        cycle_count, cycle_mean, cycle_var = self.cycles.interval_stats()
+        period_count, period_mean, period_var = self.cycles.length_stats()
+        return {
+            "tracker": self.entry.data.get("name", self.entry.title),
+            "today": snapshot.today.isoformat(),
+            "current_phase": snapshot.current_phase,
+            "cycle_day": snapshot.current_cycle_day,
+            "is_period_active": snapshot.is_period_active,
+            "last_period_start": _isoformat(snapshot.last_period_start),
+            "last_period_end": _isoformat(snapshot.last_period_end),
+            "average_cycle_length": snapshot.average_cycle_length,
+            "average_period_length": snapshot.average_period_length,
+            "next_period_date": _isoformat(snapshot.next_period_date),
+            "days_until_next_period": snapshot.days_until_next_period,
+            "days_overdue": snapshot.days_overdue,
+            "days_period_end_overdue": snapshot.days_period_end_overdue,
+            "days_left_of_period": snapshot.days_left_of_period,
+            "is_fertile_window": snapshot.is_fertile_window,
+            "is_pms_window": snapshot.is_pms_window,
+            "symptoms_today": list(snapshot.symptoms_today),
+            # Statistics over every cycle held in memory (archived years excluded)
+            "cycle_length_stats": {
+                "count": cycle_count,
+                "mean": round(cycle_mean, 1),
+                "stdev": round(cycle_var**0.5, 1),
+            },
+            "period_length_stats": {
+                "count": period_count,
+                "mean": round(period_mean, 1),
+                "stdev": round(period_var**0.5, 1),
+            },
+        }
+
+    def predictions(self, count: int) -> list[dict[str, str]]:
+        """Return the next ``count`` predicted periods with their cycle's windows.
+
+        Predictions start where the calendar's do, at the next predicted
+        period; while a period is active that is the one after it. Fertile
+        window and ovulation dates use the same cycle-day model as the phase
+        sensor.
+        """
+        snapshot = self.snapshot
+        start = snapshot.next_period_date
+        if start is None:
+            return []
+        cycle_len = timedelta(days=snapshot.average_cycle_length)
+        period_len = snapshot.average_period_length
+        ovulation_day = snapshot.average_cycle_length - 14
+        result = []
+        for _ in range(count):
+            result.append(
+                {
+                    "period_start": start.isoformat(),
+                    "period_end": (start + timedelta(days=period_len - 1)).isoformat(),
+                    "fertile_window_start": (start + timedelta(days=ovulation_day - 2)).isoformat(),
+                    "ovulation_date": (start + timedelta(days=ovulation_day - 1)).isoformat(),
+                    "fertile_window_end": (start + timedelta(days=ovulation_day + 1)).isoformat(),
+                    "pms_window_start": (start + cycle_len - timedelta(days=5)).isoformat(),
+                    "next_period_start": (start + cycle_len).isoformat(),
+                }
+            )
+            start += cycle_len
+        return result
+
+    async def async_search_symptoms(
+        self,
+        symptom: str | None,
+        severity: str | None,
+        start: date | None,
+        end: date | None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """Return one page of logged symptoms matching the filters, newest first.
+
+        ``cursor`` is the ``next_cursor`` of the previous page. Archived
+        years are searched after the in-memory log, one segment at a time,
+        only once the page is not yet full.
+        """
+        first = start.toordinal() if start else 1
+        last = end.toordinal() if end else date.max.toordinal()
+        skip = 0
+        if cursor:
+            # "<day ordinal>:<matches already returned from that day>"
+            day, _, count = cursor.partition(":")
+            last, skip = min(last, int(day)), int(count)
+
+        results: list[dict[str, str]] = []
+        next_cursor = None
+        resume_day, resume_count = last, skip
+        async for day, row in self._async_search_sources(symptom, severity, first, last):
+            if day == last and skip:
+                skip -= 1
+                continue
+            if len(results) == limit:
+                next_cursor = f"{resume_day}:{resume_count}"
+                break
+            results.append(row)
+            if day != resume_day:
+                resume_day, resume_count = day, 0
+            resume_count += 1
+        return {"results": results, "next_cursor": next_cursor}
+
+    async def _async_search_sources(
+        self, symptom: str | None, severity: str | None, first: int, last: int
+    ) -> AsyncIterator[tuple[int, dict[str, str]]]:
+        """Yield matches from memory, then from archived years, newest first."""
+        horizon = self._archived_before
+        for match in self.symptoms.search(symptom, severity, max(first, horizon), last):
+            yield match
+        if not horizon or first >= horizon:
+            return
+        first_year = date.fromordinal(first).year
+        last_year = date.fromordinal(min(last, horizon - 1)).year
+        for year in reversed(await self._archive.async_years()):
+            if first_year <= year <= last_year:
+                _history, log = await self._archive.async_get_year(year)
+                for match in log.search(symptom, severity, first, min(last, horizon - 1)):
+                    yield match
+
+    async def async_export_source(self) -> ExportSource:
+        """Return a copy of the history for write_export to read off the event loop.
+
+        The in-memory columns are copied so later mutations cannot race the
+        executor; archived years are listed here and read while writing.
+        """
+        cycles, symptoms = self.cycles.copy(), self.symptoms.copy()
+        years = await self._archive.async_years() if self._archived_before else []
+        return ExportSource(
+            self.entry.data.get("name", self.entry.title), self._archive, years, cycles, symptoms
+        )
+
+    def _compute_transitions(self) -> list[_Transition]:
+        """Return the transitions of the current cycle and the next two periods.
+
+        Dates follow the phase and PMS models of the sensors, so each event
+        fires on the day the matching sensor changes; fertile_window_end
+        fires on the window's last day, the date get_predictions reports.
+        Each event fires at local midnight of its day.
+        """
+        snapshot = self.snapshot
+        if snapshot.next_period_date is None:
+            return []
+        cycle_len = timedelta(days=snapshot.average_cycle_length)
+        ovulation_day = snapshot.average_cycle_length - 14
+        current = snapshot.next_period_date - cycle_len
+        # The next predicted period; while one is active this is the one after it.
+        base = snapshot.next_period_date
+
+        days: list[tuple[date, str, dict[str, Any]]] = []
+        for start in (current, current + cycle_len, current + 2 * cycle_len):
+            days.append((start + timedelta(days=ovulation_day - 2), EVENT_FERTILE_WINDOW_START, {}))
+            days.append((start + timedelta(days=ovulation_day - 1), EVENT_OVULATION, {}))
+            days.append((start + timedelta(days=ovulation_day + 1), EVENT_FERTILE_WINDOW_END, {}))
+        for start in (base, base + cycle_len):
+            expected = {"period_start": start.isoformat()}
+            for days_until in PERIOD_DUE_NOTICE_DAYS:
+                days.append(
+                    (
+                        start - timedelta(days=days_until),
+                        EVENT_PERIOD_DUE,
+                        {**expected, "days_until": days_until},
+                    )
+                )
+            days.append((start - timedelta(days=5), EVENT_PMS_WINDOW_START, expected))
+            days.append((start + timedelta(days=1), EVENT_PERIOD_OVERDUE, expected))
+        if snapshot.is_period_active and snapshot.last_period_start is not None:
+            days.append(
+                (
+                    snapshot.last_period_start
+                    + timedelta(days=snapshot.average_period_length - 1),
+                    EVENT_PERIOD_END_EXPECTED,
+                    {"period_start": snapshot.last_period_start.isoformat()},
+                )
+            )
+
+        tracker = {"entry_id": self.entry.entry_id, "tracker": self.entry.data.get("name")}
+        return sorted(
+            (
+                _Transition(
+                    dt_util.start_of_local_day(day),
+                    event_type,
+                    {**tracker, "date": day.isoformat(), **data},
+                )
+                for day, event_type, data in days
+            ),
+            key=lambda transition: transition.when,
+        )
+
+    @callback
+    def _async_schedule_transitions(self) -> None:
+        """Recompute the upcoming transitions after a change and arm the timer.
+
+        Only transitions still ahead are kept, so editing the history never
+        replays events for earlier today.
+        """
+        self._async_cancel_transitions()
+        now = dt_util.now()
+        self._transitions = deque(t for t in self._compute_transitions() if t.when > now)
+        self._async_arm_transition_timer()
+
+    @callback
+    def _async_arm_transition_timer(self) -> None:
+        """Schedule a callback at the next transition."""
+        if self._transitions:
+            self._transition_unsub = async_track_point_in_time(
+                self.hass, self._async_fire_transitions, self._transitions[0].when
+            )
+
+    @callback
+    def _async_fire_transitions(self, now: datetime) -> None:
+        """Fire the events that are due and arm the timer for the next one."""
+        self._transition_unsub = None
+        while self._transitions and self._transitions[0].when <= now:
+            transition = self._transitions.popleft()
+            self.hass.bus.async_fire(transition.event_type, transition.data)
+        if self._transitions:
+            self._async_arm_transition_timer()
+        else:
+            # The schedule spans more than a cycle ahead, so this only
+            # happens after a long quiet spell with nothing logged.
+            self._async_schedule_transitions()
+
+    @callback
+    def _async_cancel_transitions(self) -> None:
+        """Cancel the pending transition timer."""
+        if self._transition_unsub is not None:
+            self._transition_unsub()
+            self._transition_unsub = None
 
     @property
     def last_period_start(self) -> date | None:
         """Return the most recent period start date."""
-        if not self.cycles:
-            return None
-        last = self.cycles[-1]
-        start = last.get("start_date")
-        if start:
-            return datetime.strptime(start, "%Y-%m-%d").date()
-        return None
+        return self.snapshot.last_period_start
 
     @property
     def last_period_end(self) -> date | None:
         """Return the most recent period end date."""
-        for cycle in reversed(self.cycles):
-            end = cycle.get("end_date")
-            if end:
-                return datetime.strptime(end, "%Y-%m-%d").date()
-        return None
+        return self.snapshot.last_period_end
 
     @property
     def average_cycle_length(self) -> int:
-        """Calculate average cycle length from last 3 cycle intervals.
-
-        Uses all cycles with a start date (not just completed ones) because
-        cycle length is the interval between consecutive start dates and does
-        not require an end date.
-        """
-        starts = []
-        for c in self.cycles:
-            s = c.get("start_date")
-            if s:
-                try:
-                    starts.append(datetime.strptime(s, "%Y-%m-%d").date())
-                except ValueError:
-                    continue
-        starts.sort()
-        if len(starts) < 2:
-            return DEFAULT_CYCLE_LENGTH
-        intervals = [
-            (starts[i + 1] - starts[i]).days for i in range(len(starts) - 1)
-        ]
-        recent = intervals[-3:]
-        return round(sum(recent) / len(recent))
+        """Return the average cycle length over the last 3 cycle intervals."""
+        return self.snapshot.average_cycle_length
 
     @property
     def average_period_length(self) -> int:
-        """Calculate average period length from last 3 completed cycles."""
-        completed = self.completed_cycles
-        if not completed:
-            return DEFAULT_PERIOD_LENGTH
-        lengths = []
-        for c in completed:
-            try:
-                start = datetime.strptime(c["start_date"], "%Y-%m-%d").date()
-                end = datetime.strptime(c["end_date"], "%Y-%m-%d").date()
-                lengths.append((end - start).days + 1)
-            except (ValueError, KeyError):
-                continue
-        if not lengths:
-            return DEFAULT_PERIOD_LENGTH
-        recent = lengths[-3:]
-        return round(sum(recent) / len(recent))
+        """Return the average period length over the last 3 completed cycles."""
+        return self.snapshot.average_period_length
 
     @property
     def current_cycle_day(self) -> int | None:
         """Return current day within the predicted cycle (1-indexed, wraps with cycle length)."""
-        start = self.last_period_start
-        if not start:
-            return None
-        cycle_len = self.average_cycle_length
-        days_since = (date.today() - start).days
-        return (days_since % cycle_len) + 1
+        return self.snapshot.current_cycle_day
 
     @property
     def next_period_date(self) -> date | None:
@@ -481,64 +1693,32 @@ class CycleData:
         same cycle. The returned date may be in the past when the period is
         overdue; use days_overdue to know how many days late it is.
         """
-        start = self.last_period_start
-        if not start:
-            return None
-        cycle_len = self.average_cycle_length
-        predicted = start + timedelta(days=cycle_len)
-        today = date.today()
-        # Advance until the NEXT prediction would still be in the future,
-        # leaving predicted at the current cycle's expected start date.
-        while predicted + timedelta(days=cycle_len) <= today:
-            predicted += timedelta(days=cycle_len)
-        return predicted
+        return self.snapshot.next_period_date
 
     @property
     def days_until_next_period(self) -> int | None:
         """Days until (positive) or since (negative) the predicted period start."""
-        next_period = self.next_period_date
-        if not next_period:
-            return None
-        return (next_period - date.today()).days
+        return self.snapshot.days_until_next_period
 
     @property
     def is_period_active(self) -> bool:
         """Return True if a period is currently active (started but not yet ended)."""
-        if not self.cycles:
-            return False
-        last = self.cycles[-1]
-        return bool(last.get("start_date")) and not last.get("end_date")
+        return self.snapshot.is_period_active
 
     @property
     def current_phase(self) -> str:
         """Return the current cycle phase."""
-        cycle_day = self.current_cycle_day
-        if cycle_day is None:
-            return PHASE_UNKNOWN
-        period_len = self.average_period_length
-        cycle_len = self.average_cycle_length
-        ovulation_day = cycle_len - 14
-
-        if cycle_day <= period_len:
-            return PHASE_MENSTRUAL
-        if cycle_day < ovulation_day - 1:
-            return PHASE_FOLLICULAR
-        if cycle_day <= ovulation_day + 2:
-            return PHASE_OVULATION
-        return PHASE_LUTEAL
+        return self.snapshot.current_phase
 
     @property
     def is_fertile_window(self) -> bool:
         """Return True if currently in fertile window."""
-        return self.current_phase == PHASE_OVULATION
+        return self.snapshot.is_fertile_window
 
     @property
     def is_pms_window(self) -> bool:
         """Return True if in PMS window (last 5 days before period)."""
-        days_until = self.days_until_next_period
-        if days_until is None:
-            return False
-        return 0 <= days_until <= 5
+        return self.snapshot.is_pms_window
 
     @property
     def days_overdue(self) -> int:
@@ -548,13 +1728,7 @@ class CycleData:
         the future. Returns 0 if today is the expected start day, positive N
         if the period is N days late.
         """
-        if self.is_period_active:
-            return -1
-        next_period = self.next_period_date
-        if not next_period:
-            return -1
-        delta = (date.today() - next_period).days
-        return delta if delta >= 0 else -1
+        return self.snapshot.days_overdue
 
     @property
     def days_period_end_overdue(self) -> int:
@@ -565,13 +1739,7 @@ class CycleData:
         Returns positive N if period is N days past expected length.
         Returns negative N if N days remain before expected end.
         """
-        if not self.is_period_active:
-            return -1
-        start = self.last_period_start
-        if not start:
-            return -1
-        days_active = (date.today() - start).days + 1
-        return days_active - self.average_period_length
+        return self.snapshot.days_period_end_overdue
 
     @property
     def days_left_of_period(self) -> int | None:
@@ -581,13 +1749,9 @@ class CycleData:
         the expected end date. Returns None once the period has reached or
         passed its expected length, or when no period is active.
         """
-        overdue = self.days_period_end_overdue
-        if overdue >= 0:
-            return None
-        return -overdue
+        return self.snapshot.days_left_of_period
 
     @property
     def symptoms_today(self) -> list[dict[str, str]]:
         """Return symptoms logged today."""
-        today = date.today().isoformat()
-        return [s for s in self.symptoms if s.get("date") == today]
+        return list(self.snapshot.symptoms_today)
@@ -1,7 +1,6 @@
 """Binary sensors for the Menstrual Cycle Tracker integration."""
 from __future__ import annotations
 
-from datetime import date
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
@@ -10,6 +9,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_DAYS_ACTIVE,
@@ -39,6 +39,12 @@ class PeriodActiveSensor(BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
     _attr_icon = "mdi:water"
+    # Day counters follow from the period dates and the date, so the recorder skips them.
+    _unrecorded_attributes = frozenset(
+        {ATTR_DAYS_ACTIVE, ATTR_DAYS_PERIOD_END_OVERDUE, ATTR_DAYS_LEFT_OF_PERIOD}
+    )
+    # Availability, state and attributes as of the last state write
+    _last_written: tuple[Any, ...] | None = None
 
     def __init__(self, cycle_data: Any, entry: ConfigEntry, tracker_name: str) -> None:
         """Initialize the binary sensor."""
@@ -64,10 +70,18 @@ class PeriodActiveSensor(BinarySensorEntity):
             )
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True once the tracker's data has loaded."""
+        return self._cycle_data.loaded
+
     @callback
     def _handle_update(self) -> None:
-        """Handle update signal."""
-        self.async_write_ha_state()
+        """Write state only if the state or attributes changed since the last write."""
+        written = (self.available, self.is_on, self.extra_state_attributes)
+        if written != self._last_written:
+            self._last_written = written
+            self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
@@ -79,7 +93,7 @@ class PeriodActiveSensor(BinarySensorEntity):
         end = self._cycle_data.last_period_end
         days_active = None
         if start and self._cycle_data.is_period_active:
-            days_active = (date.today() - start).days + 1
+            days_active = (dt_util.now().date() - start).days + 1
         return {
             ATTR_DAYS_ACTIVE: days_active,
             ATTR_LAST_PERIOD_START: start.isoformat() if start else None,
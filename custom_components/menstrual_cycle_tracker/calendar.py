@@ -1,7 +1,9 @@
 """Calendar entity for the Menstrual Cycle Tracker integration."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
+from itertools import chain
 from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
@@ -10,8 +12,9 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SIGNAL_UPDATE
+from .const import CALENDAR_CACHE_SIZE, DOMAIN, SIGNAL_UPDATE
 
 
 async def async_setup_entry(
@@ -30,6 +33,8 @@ class CycleCalendar(CalendarEntity):
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # Availability and current event as of the last state write
+    _last_written: tuple[Any, ...] | None = None
 
     def __init__(self, cycle_data: Any, entry: ConfigEntry, tracker_name: str) -> None:
         """Initialize the calendar entity."""
@@ -44,6 +49,11 @@ class CycleCalendar(CalendarEntity):
             model="Menstrual Cycle Tracker",
             sw_version="2.0.0",
         )
+        # Events are cached for the (data version, today) they were built for;
+        # a mutation or the date rolling over makes every entry stale.
+        self._cache_state: tuple[int, date] | None = None
+        self._current_event: CalendarEvent | None = None
+        self._range_events: OrderedDict[tuple[date, date], list[CalendarEvent]] = OrderedDict()
 
     async def async_added_to_hass(self) -> None:
         """Register dispatcher."""
@@ -55,15 +65,39 @@ class CycleCalendar(CalendarEntity):
             )
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True once the tracker's data has loaded."""
+        return self._cycle_data.loaded
+
     @callback
     def _handle_update(self) -> None:
-        """Handle update signal."""
-        self.async_write_ha_state()
+        """Write state only if the current event changed since the last write."""
+        written = (self.available, self.event)
+        if written != self._last_written:
+            self._last_written = written
+            self.async_write_ha_state()
+
+    def _cache_valid(self, today: date) -> bool:
+        """Drop cached events built for another data version or day; return True if kept."""
+        state = (self._cycle_data.version, today)
+        if state == self._cache_state:
+            return True
+        self._cache_state = state
+        self._current_event = None
+        self._range_events.clear()
+        return False
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the current or next upcoming event."""
-        today = date.today()
+        today = dt_util.now().date()
+        if not self._cache_valid(today):
+            self._current_event = self._build_event(today)
+        return self._current_event
+
+    def _build_event(self, today: date) -> CalendarEvent | None:
+        """Build the current or next upcoming event for ``today``."""
         cd = self._cycle_data
         period_len = cd.average_period_length
 
@@ -98,61 +132,78 @@ class CycleCalendar(CalendarEntity):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a date range."""
-        events: list[CalendarEvent] = []
         cd = self._cycle_data
-        period_len = cd.average_period_length
+        if not await cd.async_wait_loaded():
+            return []
         range_start = start_date.date()
         range_end = end_date.date()
-
-        # Past and current periods from logged cycles
-        for cycle in cd.cycles:
-            c_start_str = cycle.get("start_date")
-            if not c_start_str:
-                continue
-            try:
-                c_start = datetime.strptime(c_start_str, "%Y-%m-%d").date()
-            except ValueError:
-                continue
-
-            c_end_str = cycle.get("end_date")
-            if c_end_str:
-                try:
-                    c_end = datetime.strptime(c_end_str, "%Y-%m-%d").date()
-                except ValueError:
-                    continue
-                summary = "Period"
-            else:
-                # Active period with no end date yet
-                c_end = c_start + timedelta(days=period_len - 1)
-                if c_end < date.today():
-                    c_end = date.today()
-                summary = "Period (Active)"
-
-            # Check if event overlaps with requested range
-            # CalendarEvent end is exclusive for all-day events, so add 1 day
-            event_end = c_end + timedelta(days=1)
-            if c_start < range_end and event_end > range_start:
+        today = dt_util.now().date()
+        if not self._cache_valid(today):
+            # The event cache was just reset; keep `event` consistent with it.
+            self._current_event = self._build_event(today)
+        key = (range_start, range_end)
+        events = self._range_events.get(key)
+        if events is None:
+            version = cd.version
+            events = await async_period_events(cd, range_start, range_end, today)
+            # Reading archived years may have awaited a mutation; only cache
+            # events that still match the data.
+            if (version, today) == self._cache_state:
+                self._range_events[key] = events
+                if len(self._range_events) > CALENDAR_CACHE_SIZE:
+                    self._range_events.popitem(last=False)
+        else:
+            self._range_events.move_to_end(key)
+        return list(events)
+
+
+async def async_period_events(
+    cd: Any, range_start: date, range_end: date, today: date
+) -> list[CalendarEvent]:
+    """Return the logged, active and predicted periods overlapping [range_start, range_end)."""
+    events: list[CalendarEvent] = []
+    period_len = cd.average_period_length
+
+    # Past and current periods from logged cycles, reading archived years
+    # only when the range reaches back that far
+    archived = await cd.async_archived_cycles(range_start, range_end)
+    overlapping = cd.cycles.overlapping(range_start.toordinal(), range_end.toordinal())
+    for c_start, c_end in chain(archived, overlapping):
+        if c_end is not None:
+            summary = "Period"
+        else:
+            # Active period with no end date yet
+            c_end = c_start + timedelta(days=period_len - 1)
+            if c_end < today:
+                c_end = today
+            summary = "Period (Active)"
+
+        # Check if event overlaps with requested range
+        # CalendarEvent end is exclusive for all-day events, so add 1 day
+        event_end = c_end + timedelta(days=1)
+        if c_start < range_end and event_end > range_start:
+            events.append(CalendarEvent(
+                summary=summary,
+                start=c_start,
+                end=event_end,
+            ))
+
+    # Future predicted periods - repeat forward through the requested range
+    cycle_len = cd.average_cycle_length
+    next_date = cd.next_period_date
+    if next_date:
+        # Jump straight to the first prediction that can end inside the range
+        days_behind = (range_start - next_date).days - period_len + 1
+        if days_behind > 0:
+            next_date += timedelta(days=-(-days_behind // cycle_len) * cycle_len)
+        while next_date < range_end:
+            pred_end = next_date + timedelta(days=period_len)
+            if pred_end > range_start:
                 events.append(CalendarEvent(
-                    summary=summary,
-                    start=c_start,
-                    end=event_end,
+                    summary="Period (Predicted)",
+                    start=next_date,
+                    end=pred_end,
                 ))
+            next_date = next_date + timedelta(days=cycle_len)
 
-        # Future predicted periods - repeat forward through the requested range
-        cycle_len = cd.average_cycle_length
-        next_date = cd.next_period_date
-        if next_date:
-            # If a period is active, start predictions from the cycle after
-            if cd.is_period_active:
-                next_date = next_date + timedelta(days=cycle_len)
-            while next_date < range_end:
-                pred_end = next_date + timedelta(days=period_len)
-                if pred_end > range_start:
-                    events.append(CalendarEvent(
-                        summary="Period (Predicted)",
-                        start=next_date,
-                        end=pred_end,
-                    ))
-                next_date = next_date + timedelta(days=cycle_len)
-
-        return events
+    return events
@@ -7,10 +7,25 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 
-from .const import DOMAIN
+from .const import (
+    CONF_ARCHIVE_MONTHS,
+    CONF_SAVE_DELAY,
+    CONF_STORAGE_MODE,
+    DEFAULT_ARCHIVE_MONTHS,
+    DEFAULT_SAVE_DELAY,
+    DOMAIN,
+    STORAGE_MODE_JOURNAL,
+    STORAGE_MODE_SNAPSHOT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +42,12 @@ class MenstrualCycleTrackerConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return MenstrualCycleTrackerOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -60,8 +81,8 @@ class MenstrualCycleTrackerConfigFlow(ConfigFlow, domain=DOMAIN):
                     })
 
             if not errors:
-                # Sort ascending (oldest first) so cycles[-1] is the most
-                # recent, matching the append behaviour of log_period_start.
+                # Store oldest first, matching the start-date order that
+                # CycleHistory keeps in memory.
                 initial_cycles.sort(key=lambda c: c["start_date"])
                 return self.async_create_entry(
                     title=name,
@@ -90,3 +111,60 @@ class MenstrualCycleTrackerConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=schema,
             errors=errors,
         )
+
+
+class MenstrualCycleTrackerOptionsFlow(OptionsFlow):
+    """Handle options for an existing tracker."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the tracker options."""
+        if user_input is not None:
+            return self.async_create_entry(
+                data={
+                    CONF_SAVE_DELAY: int(user_input[CONF_SAVE_DELAY]),
+                    CONF_STORAGE_MODE: user_input[CONF_STORAGE_MODE],
+                    CONF_ARCHIVE_MONTHS: int(user_input[CONF_ARCHIVE_MONTHS]),
+                }
+            )
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_SAVE_DELAY,
+                    default=options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=300,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_STORAGE_MODE,
+                    default=options.get(CONF_STORAGE_MODE, STORAGE_MODE_SNAPSHOT),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[STORAGE_MODE_SNAPSHOT, STORAGE_MODE_JOURNAL],
+                        translation_key=CONF_STORAGE_MODE,
+                    )
+                ),
+                vol.Required(
+                    CONF_ARCHIVE_MONTHS,
+                    default=options.get(CONF_ARCHIVE_MONTHS, DEFAULT_ARCHIVE_MONTHS),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=240,
+                        step=1,
+                        unit_of_measurement="months",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -1,7 +1,15 @@
 """Constants for the Menstrual Cycle Tracker integration."""
+from datetime import timedelta
 
 DOMAIN = "menstrual_cycle_tracker"
 
+# hass.data key of the tracker name index used to resolve service targets
+DATA_TRACKER_INDEX = f"{DOMAIN}_tracker_index"
+# hass.data key of the unsubscribe callback of the shared midnight timer
+DATA_DAY_ROLLOVER = f"{DOMAIN}_day_rollover"
+# hass.data key set once the iCalendar feed view is registered
+DATA_ICS_VIEW = f"{DOMAIN}_ics_view"
+
 # Services
 SERVICE_LOG_PERIOD_START = "log_period_start"
 SERVICE_LOG_PERIOD_END = "log_period_end"
@@ -9,6 +17,12 @@ SERVICE_LOG_SYMPTOM = "log_symptom"
 SERVICE_EDIT_CYCLE = "edit_cycle"
 SERVICE_DELETE_CYCLE = "delete_cycle"
 SERVICE_DELETE_SYMPTOM = "delete_symptom"
+SERVICE_IMPORT_HISTORY = "import_history"
+SERVICE_BATCH = "batch"
+SERVICE_GET_CYCLE_SUMMARY = "get_cycle_summary"
+SERVICE_GET_PREDICTIONS = "get_predictions"
+SERVICE_SEARCH_SYMPTOMS = "search_symptoms"
+SERVICE_EXPORT_HISTORY = "export_history"
 
 # Phase names
 PHASE_MENSTRUAL = "Menstrual"
@@ -27,13 +41,54 @@ ATTR_DAYS_PERIOD_END_OVERDUE = "days_period_end_overdue"
 ATTR_DAYS_LEFT_OF_PERIOD = "days_left_of_period"
 ATTR_IS_PMS_WINDOW = "is_pms_window"
 ATTR_CYCLE_DAY = "cycle_day"
+ATTR_SYMPTOMS = "symptoms"
+ATTR_SYMPTOMS_TRUNCATED = "symptoms_truncated"
+
+# Most symptom entries put in a state attribute; search_symptoms returns the rest
+MAX_SYMPTOM_ATTRIBUTES = 10
 
 # Dispatcher signals
 SIGNAL_UPDATE = f"{DOMAIN}_update"
 
+# Bus events fired at midnight on the day a predicted transition happens
+EVENT_PERIOD_DUE = f"{DOMAIN}_period_due"
+EVENT_PERIOD_OVERDUE = f"{DOMAIN}_period_overdue"
+EVENT_PERIOD_END_EXPECTED = f"{DOMAIN}_period_end_expected"
+EVENT_PMS_WINDOW_START = f"{DOMAIN}_pms_window_start"
+EVENT_FERTILE_WINDOW_START = f"{DOMAIN}_fertile_window_start"
+EVENT_OVULATION = f"{DOMAIN}_ovulation"
+EVENT_FERTILE_WINDOW_END = f"{DOMAIN}_fertile_window_end"
+# Days before a predicted start to fire period_due; covers the blueprint's 1-7 day warning
+PERIOD_DUE_NOTICE_DAYS = (7, 6, 5, 4, 3, 2, 1, 0)
+
+# Options
+CONF_SAVE_DELAY = "save_delay"
+CONF_STORAGE_MODE = "storage_mode"
+CONF_ARCHIVE_MONTHS = "archive_months"
+
+# Storage modes
+STORAGE_MODE_SNAPSHOT = "snapshot"
+STORAGE_MODE_JOURNAL = "journal"
+
 # Default values
 DEFAULT_CYCLE_LENGTH = 28
 DEFAULT_PERIOD_LENGTH = 5
+DEFAULT_SAVE_DELAY = 5  # seconds; 0 writes every change through immediately
+DEFAULT_ARCHIVE_MONTHS = 0  # 0 keeps the whole history in memory
 
 # Storage
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2  # 2: ordinal columns; version 1 files are migrated on load
+JOURNAL_MAX_RECORDS = 500  # compact once the journal holds this many records
+JOURNAL_COMPACT_INTERVAL = timedelta(hours=6)
+ARCHIVE_INTERVAL = timedelta(days=1)
+ARCHIVE_CACHE_SIZE = 3  # parsed archive years kept in memory
+CALENDAR_CACHE_SIZE = 16  # event lists kept per calendar, by requested range
+
+# Export
+EXPORT_DIRECTORY = f"{DOMAIN}_exports"  # under the config directory
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_JSON = "json"
+EXPORT_CHUNK_ROWS = 1000  # rows serialised per write
+
+# iCalendar feed
+ICS_PREDICTION_DAYS = 365  # predicted periods included ahead of today
@@ -0,0 +1,762 @@
+"""In-memory history structures for the Menstrual Cycle Tracker integration."""
+from __future__ import annotations
+
+import heapq
+import logging
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from itertools import chain
+from operator import itemgetter
+from typing import Any, NamedTuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# End ordinal stored for a cycle that has no end date yet. Day ordinals start
+# at 1 (0001-01-01), so 0 can never collide with a real date.
+OPEN_END = 0
+
+_MAX_ORDINAL = date.max.toordinal()
+
+# Severity strings by their stored one-byte code; "" means not specified.
+SEVERITIES = ("", "mild", "moderate", "severe")
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(SEVERITIES)}
+
+# Number of most recent intervals/periods the rolling averages look at.
+STATS_WINDOW = 3
+
+
+class Cycle(NamedTuple):
+    """A single logged period."""
+
+    start: date
+    end: date | None
+
+
+def to_ordinal(value: str | None) -> int | None:
+    """Parse an ISO date string into a day ordinal, or None if empty/invalid."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_ordinal(value: Any) -> bool:
+    """Return True if ``value`` is a valid stored day ordinal."""
+    return isinstance(value, int) and 0 < value <= _MAX_ORDINAL
+
+
+class CycleHistory:
+    """Logged cycles stored as parallel columns of start/end day ordinals.
+
+    Dates are parsed once when the history is built from storage; everything
+    afterwards works on plain integers. The store keeps them as ordinals too
+    (``as_columns``); only ``as_storage`` turns them back into ISO strings.
+
+    The columns are kept sorted by start date, so the start column doubles as
+    a bisectable index: lookups are O(log n) and the newest cycle is always
+    the last one, whatever order the cycles were logged or edited in.
+
+    Rolling statistics are maintained by the mutators: the sum of the last N
+    intervals telescopes to ``starts[-1] - starts[-1 - N]``, running sums
+    cover variance, and the most recent completed period lengths are cached.
+    Reading them never walks the history.
+
+    Range queries use a running maximum of end days alongside the starts,
+    rebuilt lazily after a mutation; see ``overlapping``.
+    """
+
+    __slots__ = (
+        "_starts",
+        "_ends",
+        "_open_starts",
+        "_interval_sumsq",
+        "_length_count",
+        "_length_sum",
+        "_length_sumsq",
+        "_recent_lengths",
+        "_reach",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self._starts = array("i")
+        self._ends = array("i")
+        self._open_starts = array("i")
+        self._interval_sumsq = 0
+        self._length_count = 0
+        self._length_sum = 0
+        self._length_sumsq = 0
+        self._recent_lengths: tuple[int, ...] = ()
+        # Running maximum of closed end days (start days for open cycles), or
+        # None until the next range query rebuilds it. Never mutated in place.
+        self._reach: array | None = None
+
+    @classmethod
+    def from_storage(cls, raw: list[dict[str, Any]]) -> CycleHistory:
+        """Build a history from a list of ``start_date``/``end_date`` dicts."""
+        rows: list[tuple[int, int]] = []
+        for item in raw:
+            start = to_ordinal(item.get("start_date"))
+            end_str = item.get("end_date")
+            end = to_ordinal(end_str)
+            if start is None or (end_str and end is None):
+                _LOGGER.warning("Skipping malformed stored cycle: %s", item)
+                continue
+            rows.append((start, end or OPEN_END))
+        rows.sort(key=lambda row: row[0])
+        history = cls()
+        history._starts = array("i", (start for start, _ in rows))
+        history._ends = array("i", (end for _, end in rows))
+        history._rebuild_stats()
+        return history
+
+    def as_storage(self, count: int | None = None) -> list[dict[str, str]]:
+        """Return the history (or its oldest ``count`` cycles) as start/end dicts."""
+        return [
+            {
+                "start_date": date.fromordinal(start).isoformat(),
+                "end_date": date.fromordinal(end).isoformat() if end else "",
+            }
+            for start, end in zip(self._starts[:count], self._ends[:count])
+        ]
+
+    @classmethod
+    def from_columns(cls, raw: dict[str, list[Any]]) -> CycleHistory:
+        """Build a history from the stored ``start``/``end`` ordinal columns.
+
+        Open cycles have a null end.
+        """
+        rows: list[tuple[int, int]] = []
+        for start, end in zip(raw.get("start", []), raw.get("end", [])):
+            if not _is_ordinal(start) or not (end is None or _is_ordinal(end)):
+                _LOGGER.warning("Skipping malformed stored cycle: %s, %s", start, end)
+                continue
+            rows.append((start, end or OPEN_END))
+        rows.sort(key=lambda row: row[0])
+        history = cls()
+        history._starts = array("i", (start for start, _ in rows))
+        history._ends = array("i", (end for _, end in rows))
+        history._rebuild_stats()
+        return history
+
+    def as_columns(self) -> dict[str, list[int | None]]:
+        """Return the history as ordinal columns, the compact on-disk form."""
+        return {
+            "start": self._starts.tolist(),
+            "end": [end or None for end in self._ends],
+        }
+
+    def copy(self) -> CycleHistory:
+        """Return an independent copy of the history."""
+        clone = CycleHistory.__new__(CycleHistory)
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone._starts = self._starts[:]
+        clone._ends = self._ends[:]
+        clone._open_starts = self._open_starts[:]
+        return clone
+
+    def __len__(self) -> int:
+        """Return the number of cycles."""
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Cycle]:
+        """Iterate over cycles, oldest first."""
+        for start, end in zip(self._starts, self._ends):
+            yield Cycle(date.fromordinal(start), date.fromordinal(end) if end else None)
+
+    def __getitem__(self, index: int) -> Cycle:
+        """Return the cycle at ``index``."""
+        end = self._ends[index]
+        return Cycle(
+            date.fromordinal(self._starts[index]),
+            date.fromordinal(end) if end else None,
+        )
+
+    @property
+    def starts(self) -> array:
+        """Start ordinals, ascending (do not mutate)."""
+        return self._starts
+
+    @property
+    def ends(self) -> array:
+        """End ordinals aligned with ``starts``, ``OPEN_END`` for open cycles (do not mutate)."""
+        return self._ends
+
+    def find(self, start: date) -> int:
+        """Return the index of the cycle starting on ``start``, or -1."""
+        target = start.toordinal()
+        pos = bisect_left(self._starts, target)
+        if pos < len(self._starts) and self._starts[pos] == target:
+            return pos
+        return -1
+
+    def overlapping(self, first: int, last: int) -> Iterator[Cycle]:
+        """Yield the cycles overlapping the day ordinals [first, last), oldest first.
+
+        A closed cycle covers its start through its end day. An open cycle
+        has not ended, so it is yielded whenever it starts before ``last``.
+        The running maximum of end days is bisected to the first closed
+        cycle that reaches ``first`` and the walk stops at the first start
+        at or past ``last``, so the cost follows the cycles returned rather
+        than the length of the history.
+        """
+        starts, ends = self._starts, self._ends
+        stop = bisect_left(starts, last)
+        pos = min(bisect_left(self._reach_index(), first), stop)
+        # Open cycles starting before ``bound`` are the only earlier ones still
+        # running; the walk begins at the first cycle sharing that start.
+        bound = starts[pos] if pos < stop else last
+        pos = bisect_left(starts, bound, 0, pos)
+        for start in self._open_starts[: bisect_left(self._open_starts, bound)]:
+            yield Cycle(date.fromordinal(start), None)
+        for i in range(pos, stop):
+            end = ends[i]
+            if end == OPEN_END:
+                yield Cycle(date.fromordinal(starts[i]), None)
+            elif end >= first:
+                yield Cycle(date.fromordinal(starts[i]), date.fromordinal(end))
+
+    def newest_open(self) -> int:
+        """Return the index of the latest-starting open cycle, or -1."""
+        if not self._open_starts:
+            return -1
+        target = self._open_starts[-1]
+        pos = bisect_right(self._starts, target) - 1
+        while self._ends[pos] != OPEN_END:
+            pos -= 1
+        return pos
+
+    def insert(self, start: date, end: date | None = None) -> int:
+        """Add a cycle in start-date order and return its index."""
+        return self._insert(start.toordinal(), end.toordinal() if end else OPEN_END)
+
+    def set_start(self, index: int, start: date) -> int:
+        """Move the cycle at ``index`` to a new start date and return its new index."""
+        end = self._ends[index]
+        self._remove(index)
+        return self._insert(start.toordinal(), end)
+
+    def set_end(self, index: int, end: date | None) -> None:
+        """Change the end date of the cycle at ``index``."""
+        start = self._starts[index]
+        old = self._ends[index]
+        new = end.toordinal() if end else OPEN_END
+        self._remove_length(start, old)
+        self._ends[index] = new
+        self._add_length(start, new)
+        if old == OPEN_END and new != OPEN_END:
+            del self._open_starts[bisect_left(self._open_starts, start)]
+        elif old != OPEN_END and new == OPEN_END:
+            insort(self._open_starts, start)
+        self._reach = None
+        self._refresh_recent_lengths()
+
+    def pop(self, index: int) -> Cycle:
+        """Remove and return the cycle at ``index``."""
+        cycle = self[index]
+        self._remove(index % len(self._starts))
+        return cycle
+
+    def merge(self, rows: Iterable[tuple[int, int]]) -> int:
+        """Add ``(start, end)`` ordinal rows in bulk and return how many changed the history.
+
+        Rows whose start is already logged are skipped, except that an open
+        cycle takes the end of a matching closed row. Existing cycles are
+        never dropped, even ones sharing a start day. New rows are merged
+        into the sorted columns and the statistics rebuilt once for the
+        whole batch.
+        """
+        starts, ends = self._starts, self._ends
+        added: dict[int, int] = {}
+        changed = 0
+        for start, end in rows:
+            pos = bisect_left(starts, start)
+            if pos < len(starts) and starts[pos] == start:
+                # Close the first open cycle logged on that day, if any.
+                while pos < len(starts) and starts[pos] == start:
+                    if ends[pos] == OPEN_END and end != OPEN_END:
+                        ends[pos] = end
+                        changed += 1
+                        break
+                    pos += 1
+                continue
+            current = added.get(start)
+            if current is None or (current == OPEN_END and end != OPEN_END):
+                added[start] = end
+                changed += 1
+        if not changed:
+            return 0
+        if added:
+            ordered = list(heapq.merge(zip(starts, ends), sorted(added.items())))
+            self._starts = array("i", (start for start, _ in ordered))
+            self._ends = array("i", (end for _, end in ordered))
+        self._rebuild_stats()
+        return changed
+
+    def pop_before(self, ordinal: int, keep: int = 0) -> list[dict[str, str]]:
+        """Remove cycles starting before a day ordinal and return them in storage form.
+
+        The newest ``keep`` cycles always stay, so the rolling averages keep
+        the history they need.
+        """
+        count = min(bisect_left(self._starts, ordinal), max(len(self._starts) - keep, 0))
+        if count <= 0:
+            return []
+        removed = self.as_storage(count)
+        del self._starts[:count]
+        del self._ends[:count]
+        self._rebuild_stats()
+        return removed
+
+    def interval_window(self) -> tuple[int, int]:
+        """Return (sum, count) of the most recent start-to-start intervals."""
+        starts = self._starts
+        count = min(STATS_WINDOW, len(starts) - 1)
+        if count <= 0:
+            return 0, 0
+        return starts[-1] - starts[-1 - count], count
+
+    def length_window(self) -> tuple[int, int]:
+        """Return (sum, count) of the most recent completed period lengths."""
+        return sum(self._recent_lengths), len(self._recent_lengths)
+
+    def interval_stats(self) -> tuple[int, float, float]:
+        """Return (count, mean, variance) over all start-to-start intervals."""
+        starts = self._starts
+        count = len(starts) - 1
+        if count <= 0:
+            return 0, 0.0, 0.0
+        mean = (starts[-1] - starts[0]) / count
+        return count, mean, max(self._interval_sumsq / count - mean * mean, 0.0)
+
+    def length_stats(self) -> tuple[int, float, float]:
+        """Return (count, mean, variance) over all completed period lengths."""
+        count = self._length_count
+        if not count:
+            return 0, 0.0, 0.0
+        mean = self._length_sum / count
+        return count, mean, max(self._length_sumsq / count - mean * mean, 0.0)
+
+    def _insert(self, start: int, end: int) -> int:
+        """Insert a row at its sorted position, updating the statistics."""
+        starts = self._starts
+        pos = bisect_right(starts, start)
+        prev = starts[pos - 1] if pos > 0 else None
+        nxt = starts[pos] if pos < len(starts) else None
+        if prev is not None and nxt is not None:
+            self._interval_sumsq -= (nxt - prev) ** 2
+        if prev is not None:
+            self._interval_sumsq += (start - prev) ** 2
+        if nxt is not None:
+            self._interval_sumsq += (nxt - start) ** 2
+        starts.insert(pos, start)
+        self._ends.insert(pos, end)
+        if end == OPEN_END:
+            insort(self._open_starts, start)
+        self._reach = None
+        self._add_length(start, end)
+        self._refresh_recent_lengths()
+        return pos
+
+    def _remove(self, pos: int) -> None:
+        """Remove the row at ``pos``, updating the statistics."""
+        starts = self._starts
+        start = starts[pos]
+        end = self._ends[pos]
+        prev = starts[pos - 1] if pos > 0 else None
+        nxt = starts[pos + 1] if pos + 1 < len(starts) else None
+        if prev is not None:
+            self._interval_sumsq -= (start - prev) ** 2
+        if nxt is not None:
+            self._interval_sumsq -= (nxt - start) ** 2
+        if prev is not None and nxt is not None:
+            self._interval_sumsq += (nxt - prev) ** 2
+        del starts[pos]
+        del self._ends[pos]
+        if end == OPEN_END:
+            del self._open_starts[bisect_left(self._open_starts, start)]
+        self._reach = None
+        self._remove_length(start, end)
+        self._refresh_recent_lengths()
+
+    def _rebuild_stats(self) -> None:
+        """Recompute every rolling statistic from the columns."""
+        starts = self._starts
+        self._interval_sumsq = sum(
+            (starts[i + 1] - starts[i]) ** 2 for i in range(len(starts) - 1)
+        )
+        self._open_starts = array(
+            "i", (start for start, end in zip(starts, self._ends) if end == OPEN_END)
+        )
+        self._length_count = self._length_sum = self._length_sumsq = 0
+        for start, end in zip(starts, self._ends):
+            self._add_length(start, end)
+        self._reach = None
+        self._refresh_recent_lengths()
+
+    def _reach_index(self) -> array:
+        """Return the running maximum of end days, rebuilding it if stale."""
+        if self._reach is None:
+            reach = array("i")
+            top = 0
+            for start, end in zip(self._starts, self._ends):
+                top = max(top, start if end == OPEN_END else end)
+                reach.append(top)
+            self._reach = reach
+        return self._reach
+
+    def _add_length(self, start: int, end: int) -> None:
+        """Count a completed period in the running length sums."""
+        if end == OPEN_END:
+            return
+        length = end - start + 1
+        self._length_count += 1
+        self._length_sum += length
+        self._length_sumsq += length * length
+
+    def _remove_length(self, start: int, end: int) -> None:
+        """Remove a completed period from the running length sums."""
+        if end == OPEN_END:
+            return
+        length = end - start + 1
+        self._length_count -= 1
+        self._length_sum -= length
+        self._length_sumsq -= length * length
+
+    def _refresh_recent_lengths(self) -> None:
+        """Collect the most recent completed period lengths, newest last.
+
+        Walks back from the newest cycle, skipping open ones, so it touches
+        only the last few records in practice.
+        """
+        recent: list[int] = []
+        starts = self._starts
+        ends = self._ends
+        for i in range(len(ends) - 1, -1, -1):
+            if ends[i] != OPEN_END:
+                recent.append(ends[i] - starts[i] + 1)
+                if len(recent) == STATS_WINDOW:
+                    break
+        recent.reverse()
+        self._recent_lengths = tuple(recent)
+
+
+class SymptomLog:
+    """Logged symptoms stored as columns sorted by date.
+
+    Each symptom is a day ordinal, an id into a table of interned symptom
+    names and a one-byte severity code, instead of a three-key dict of
+    strings. Entries for a day are contiguous, so per-day reads and deletes
+    bisect to that day and touch only its entries.
+
+    An inverted index keeps, per name id, the sorted days that name was
+    logged on, so searching for one symptom only visits the days it occurs.
+    """
+
+    __slots__ = (
+        "_dates",
+        "_names",
+        "_severities",
+        "_name_table",
+        "_name_ids",
+        "_name_dates",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty log."""
+        self._dates = array("i")
+        self._names = array("I")
+        self._severities = array("B")
+        self._name_table: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._name_dates: dict[int, array] = {}
+
+    @classmethod
+    def from_storage(cls, raw: list[dict[str, str]]) -> SymptomLog:
+        """Build a log from a list of symptom dicts."""
+        rows: list[tuple[int, int, int]] = []
+        log = cls()
+        for item in raw:
+            day = to_ordinal(item.get("date"))
+            severity = item.get("severity") or ""
+            if day is None or severity not in _SEVERITY_CODES:
+                _LOGGER.warning("Skipping malformed stored symptom: %s", item)
+                continue
+            rows.append(
+                (day, log._name_id(item.get("symptom", "")), _SEVERITY_CODES[severity])
+            )
+        rows.sort(key=lambda row: row[0])
+        log._dates = array("i", (row[0] for row in rows))
+        log._names = array("I", (row[1] for row in rows))
+        log._severities = array("B", (row[2] for row in rows))
+        log._rebuild_index()
+        return log
+
+    @classmethod
+    def from_columns(cls, raw: dict[str, list[Any]]) -> SymptomLog:
+        """Build a log from the stored columns.
+
+        ``date`` holds day ordinals, ``name`` ids into the ``names`` table and
+        ``severity`` indexes into ``SEVERITIES``.
+        """
+        log = cls()
+        # Stored ids are positions in the stored table; map them onto the
+        # interned table, which also folds any duplicate names together.
+        name_ids = [log._name_id(str(name)) for name in raw.get("names", [])]
+        rows: list[tuple[int, int, int]] = []
+        for day, name, severity in zip(
+            raw.get("date", []), raw.get("name", []), raw.get("severity", [])
+        ):
+            if (
+                not _is_ordinal(day)
+                or not isinstance(name, int)
+                or not 0 <= name < len(name_ids)
+                or not isinstance(severity, int)
+                or not 0 <= severity < len(SEVERITIES)
+            ):
+                _LOGGER.warning(
+                    "Skipping malformed stored symptom: %s, %s, %s", day, name, severity
+                )
+                continue
+            rows.append((day, name_ids[name], severity))
+        rows.sort(key=lambda row: row[0])
+        log._dates = array("i", (row[0] for row in rows))
+        log._names = array("I", (row[1] for row in rows))
+        log._severities = array("B", (row[2] for row in rows))
+        log._rebuild_index()
+        return log
+
+    def as_storage(self) -> list[dict[str, str]]:
+        """Return the log as a list of symptom dicts."""
+        return list(self)
+
+    def as_columns(self) -> dict[str, list[Any]]:
+        """Return the log as columns, the compact on-disk form.
+
+        Only names still in use are written, renumbered in first-use order.
+        """
+        names: list[str] = []
+        remap: dict[int, int] = {}
+        name_column: list[int] = []
+        for name_id in self._names:
+            stored_id = remap.get(name_id)
+            if stored_id is None:
+                stored_id = remap[name_id] = len(names)
+                names.append(self._name_table[name_id])
+            name_column.append(stored_id)
+        return {
+            "names": names,
+            "date": self._dates.tolist(),
+            "name": name_column,
+            "severity": self._severities.tolist(),
+        }
+
+    def copy(self) -> SymptomLog:
+        """Return an independent copy of the log."""
+        clone = SymptomLog()
+        clone._dates = self._dates[:]
+        clone._names = self._names[:]
+        clone._severities = self._severities[:]
+        clone._name_table = self._name_table[:]
+        clone._name_ids = self._name_ids.copy()
+        clone._name_dates = {name_id: days[:] for name_id, days in self._name_dates.items()}
+        return clone
+
+    def __len__(self) -> int:
+        """Return the number of logged symptoms."""
+        return len(self._dates)
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        """Iterate over logged symptoms, oldest first."""
+        for i in range(len(self._dates)):
+            yield self._row(i)
+
+    @property
+    def dates(self) -> array:
+        """Day ordinal of each entry, ascending (do not mutate)."""
+        return self._dates
+
+    def on(self, day: date) -> list[dict[str, str]]:
+        """Return the symptoms logged on ``day`` in the order they were logged."""
+        lo, hi = self._day_range(day.toordinal())
+        return [self._row(i) for i in range(lo, hi)]
+
+    def has(self, day: date, symptom: str) -> bool:
+        """Return True if ``symptom`` was logged on ``day``."""
+        return self._find(day, symptom) >= 0
+
+    def add(self, day: date, symptom: str, severity: str) -> None:
+        """Log a symptom."""
+        ordinal = day.toordinal()
+        name_id = self._name_id(symptom)
+        pos = bisect_right(self._dates, ordinal)
+        self._dates.insert(pos, ordinal)
+        self._names.insert(pos, name_id)
+        self._severities.insert(pos, _SEVERITY_CODES[severity])
+        insort(self._name_dates.setdefault(name_id, array("i")), ordinal)
+
+    def remove(self, day: date, symptom: str) -> bool:
+        """Remove the first ``symptom`` logged on ``day``. Returns True if found."""
+        pos = self._find(day, symptom)
+        if pos < 0:
+            return False
+        days = self._name_dates[self._names[pos]]
+        del days[bisect_left(days, self._dates[pos])]
+        del self._dates[pos]
+        del self._names[pos]
+        del self._severities[pos]
+        return True
+
+    def merge(self, rows: Iterable[tuple[int, str, str]]) -> int:
+        """Add ``(day, symptom, severity)`` rows in bulk and return how many were new.
+
+        A symptom already logged on the same day is skipped. New rows follow
+        the existing ones of their day, and the columns are sorted once.
+        """
+        seen = set(zip(self._dates, self._names))
+        new: list[tuple[int, int, int]] = []
+        for day, symptom, severity in rows:
+            key = (day, self._name_id(symptom))
+            if key in seen:
+                continue
+            seen.add(key)
+            new.append((*key, _SEVERITY_CODES[severity]))
+        if new:
+            merged = sorted(
+                chain(zip(self._dates, self._names, self._severities), new),
+                key=itemgetter(0),
+            )
+            self._dates = array("i", (row[0] for row in merged))
+            self._names = array("I", (row[1] for row in merged))
+            self._severities = array("B", (row[2] for row in merged))
+            self._rebuild_index()
+        return len(new)
+
+    def pop_before(self, ordinal: int) -> list[dict[str, str]]:
+        """Remove symptoms logged before a day ordinal and return them in storage form."""
+        count = bisect_left(self._dates, ordinal)
+        removed = [self._row(i) for i in range(count)]
+        del self._dates[:count]
+        del self._names[:count]
+        del self._severities[:count]
+        for days in self._name_dates.values():
+            del days[: bisect_left(days, ordinal)]
+        return removed
+
+    def search(
+        self, symptom: str | None, severity: str | None, first: int, last: int
+    ) -> Iterator[tuple[int, dict[str, str]]]:
+        """Yield ``(day, symptom)`` matches logged from ``last`` back to ``first``.
+
+        Days are visited newest first and a day's entries in logged order.
+        ``symptom`` matches names case-insensitively; with one, only days in
+        its index are visited. Either way the walk starts with a bisect and
+        is lazy, so taking a page of results costs O(log n) plus the page.
+        """
+        code = None if severity is None else _SEVERITY_CODES[severity]
+        if symptom is None:
+            name_ids = None
+            days = self._days_between(self._dates, first, last)
+        else:
+            wanted = symptom.casefold()
+            name_ids = {
+                name_id
+                for name_id, name in enumerate(self._name_table)
+                if name.casefold() == wanted
+            }
+            days = heapq.merge(
+                *(
+                    self._days_between(self._name_dates.get(name_id, array("i")), first, last)
+                    for name_id in name_ids
+                ),
+                reverse=True,
+            )
+        previous = None
+        for day in days:
+            if day == previous:
+                continue
+            previous = day
+            lo, hi = self._day_range(day)
+            for i in range(lo, hi):
+                if (name_ids is None or self._names[i] in name_ids) and (
+                    code is None or self._severities[i] == code
+                ):
+                    yield day, self._row(i)
+
+    @staticmethod
+    def _days_between(column: array, first: int, last: int) -> Iterator[int]:
+        """Yield the values of a sorted column within [first, last], descending."""
+        for i in range(bisect_right(column, last) - 1, bisect_left(column, first) - 1, -1):
+            yield column[i]
+
+    def _rebuild_index(self) -> None:
+        """Recompute the per-name day index from the columns."""
+        index: dict[int, array] = {}
+        for day, name_id in zip(self._dates, self._names):
+            index.setdefault(name_id, array("i")).append(day)
+        self._name_dates = index
+
+    def _row(self, index: int) -> dict[str, str]:
+        """Materialise the symptom at ``index`` in its dict form."""
+        return {
+            "date": date.fromordinal(self._dates[index]).isoformat(),
+            "symptom": self._name_table[self._names[index]],
+            "severity": SEVERITIES[self._severities[index]],
+        }
+
+    def _day_range(self, ordinal: int) -> tuple[int, int]:
+        """Return the [lo, hi) row range logged on a day ordinal."""
+        return bisect_left(self._dates, ordinal), bisect_right(self._dates, ordinal)
+
+    def _find(self, day: date, symptom: str) -> int:
+        """Return the row of the first ``symptom`` logged on ``day``, or -1."""
+        name_id = self._name_ids.get(symptom)
+        if name_id is None:
+            return -1
+        lo, hi = self._day_range(day.toordinal())
+        for i in range(lo, hi):
+            if self._names[i] == name_id:
+                return i
+        return -1
+
+    def _name_id(self, symptom: str) -> int:
+        """Return the id of an interned symptom name, adding it if new."""
+        name_id = self._name_ids.get(symptom)
+        if name_id is None:
+            name_id = self._name_ids[symptom] = len(self._name_table)
+            self._name_table.append(sys.intern(symptom))
+        return name_id
+
+
+@dataclass(frozen=True, slots=True)
+class CycleSnapshot:
+    """Derived state of a tracker for a single day.
+
+    Computed once per (data version, date) and shared by every entity of the
+    tracker, so a state write does not re-derive the statistics per entity.
+    """
+
+    version: int
+    today: date
+    average_cycle_length: int
+    average_period_length: int
+    last_period_start: date | None
+    last_period_end: date | None
+    is_period_active: bool
+    current_cycle_day: int | None
+    next_period_date: date | None
+    days_until_next_period: int | None
+    current_phase: str
+    is_fertile_window: bool
+    is_pms_window: bool
+    days_overdue: int
+    days_period_end_overdue: int
+    days_left_of_period: int | None
+    symptoms_today: tuple[dict[str, str], ...]
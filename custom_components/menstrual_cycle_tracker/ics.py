@@ -0,0 +1,150 @@
+"""iCalendar feed of each tracker's calendar for external calendar clients.
+
+``GET /api/menstrual_cycle_tracker/ics/<calendar entity id>`` returns the
+calendar's logged, active and predicted periods as an ``.ics`` document.
+Responses carry a strong ETag built from the tracker's data version, so a
+client polling with ``If-None-Match`` gets an empty 304 until the history
+changes or the date rolls over.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date
+from http import HTTPStatus
+
+from aiohttp import hdrs, web
+
+from homeassistant.components import http
+from homeassistant.components.calendar import CalendarEvent
+from homeassistant.const import Platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .calendar import async_period_events
+from .const import DOMAIN, ICS_PREDICTION_DAYS
+
+# Event summary -> UID kind, so a logged and a predicted period never share a UID
+_UID_KINDS = {
+    "Period": "period",
+    "Period (Active)": "active",
+    "Period (Predicted)": "predicted",
+}
+
+
+class CycleCalendarFeedView(http.HomeAssistantView):
+    """Serve a tracker's calendar as an iCalendar feed."""
+
+    url = f"/api/{DOMAIN}/ics/{{entity_id}}"
+    name = f"api:{DOMAIN}:ics"
+
+    async def get(self, request: web.Request, entity_id: str) -> web.StreamResponse:
+        """Return the feed, or 304 if the client's copy is current."""
+        hass = request.app[http.KEY_HASS]
+        entity = er.async_get(hass).async_get(entity_id)
+        if (
+            entity is None
+            or entity.platform != DOMAIN
+            or entity.domain != Platform.CALENDAR
+            or entity.config_entry_id not in hass.data.get(DOMAIN, {})
+        ):
+            return self.json_message("Calendar not found", HTTPStatus.NOT_FOUND)
+        cd = hass.data[DOMAIN][entity.config_entry_id]
+        if not await cd.async_wait_loaded():
+            return self.json_message("Tracker failed to load", HTTPStatus.SERVICE_UNAVAILABLE)
+
+        today = dt_util.now().date()
+        # Active periods stretch to today, so the feed changes daily as well.
+        etag = f'"{cd.load_token}-{cd.version}-{today.toordinal()}"'
+        headers = {hdrs.ETAG: etag, hdrs.CACHE_CONTROL: "private, no-cache"}
+        if_none_match = request.if_none_match or ()
+        if any(tag.value in ("*", etag[1:-1]) for tag in if_none_match):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        response = web.StreamResponse(headers=headers)
+        response.content_type = "text/calendar"
+        response.charset = "utf-8"
+        await response.prepare(request)
+        name = cd.entry.data.get("name", cd.entry.title)
+        await response.write(_encode(_header(name)))
+        # One year of events per write, each at most a year of archive reads;
+        # an event is written by the window it starts in. A mutation landing
+        # mid-stream changes the version, so the next poll fetches a fresh copy.
+        start = await cd.async_history_start()
+        if start is not None:
+            end = date.fromordinal(today.toordinal() + ICS_PREDICTION_DAYS)
+            for year in range(start.year, end.year + 1):
+                window_start = max(start, date(year, 1, 1))
+                window_end = min(end, date(year + 1, 1, 1))
+                events = await async_period_events(cd, window_start, window_end, today)
+                lines = [
+                    line
+                    for event in events
+                    if event.start >= window_start
+                    for line in _vevent(entity.config_entry_id, event)
+                ]
+                if lines:
+                    await response.write(_encode(lines))
+        await response.write(_encode(["END:VCALENDAR"]))
+        await response.write_eof()
+        return response
+
+
+def _header(name: str) -> list[str]:
+    """Return the lines opening the feed."""
+    return [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{DOMAIN}//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ]
+
+
+def _vevent(entry_id: str, event: CalendarEvent) -> Iterator[str]:
+    """Yield the lines of one all-day event.
+
+    The UID and DTSTAMP depend only on the event, so an unchanged history
+    renders to the same bytes and the strong ETag holds.
+    """
+    start = f"{event.start:%Y%m%d}"
+    yield "BEGIN:VEVENT"
+    yield f"UID:{start}-{_UID_KINDS[event.summary]}-{entry_id}@{DOMAIN}"
+    yield f"DTSTAMP:{start}T000000Z"
+    yield f"DTSTART;VALUE=DATE:{start}"
+    yield f"DTEND;VALUE=DATE:{event.end:%Y%m%d}"
+    yield f"SUMMARY:{_escape(event.summary)}"
+    yield "TRANSP:TRANSPARENT"
+    yield "END:VEVENT"
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value (RFC 5545 section 3.3.11)."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _encode(lines: list[str]) -> bytes:
+    """Return lines as CRLF-terminated bytes, folded at 75 octets."""
+    return "".join(_fold(line) for line in lines).encode()
+
+
+def _fold(line: str) -> str:
+    """Fold a content line longer than 75 octets onto continuation lines."""
+    if len(line.encode()) <= 75:
+        return f"{line}\r\n"
+    parts: list[str] = []
+    current = ""
+    limit = 75
+    for char in line:
+        if len((current + char).encode()) > limit:
+            parts.append(current)
+            # Continuation lines start with a space, which counts towards 75.
+            current, limit = char, 74
+        else:
+            current += char
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
@@ -15,7 +15,10 @@ from .const import (
     ATTR_DAYS_OVERDUE,
     ATTR_DAYS_UNTIL_NEXT,
     ATTR_IS_PMS_WINDOW,
+    ATTR_SYMPTOMS,
+    ATTR_SYMPTOMS_TRUNCATED,
     DOMAIN,
+    MAX_SYMPTOM_ATTRIBUTES,
     SIGNAL_UPDATE,
 )
 
@@ -49,6 +52,8 @@ class CycleTrackerSensorBase(SensorEntity):
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # Availability, value and attributes as of the last state write
+    _last_written: tuple[Any, ...] | None = None
 
     def __init__(self, cycle_data: Any, entry: ConfigEntry, tracker_name: str) -> None:
         """Initialize the sensor."""
@@ -73,10 +78,18 @@ class CycleTrackerSensorBase(SensorEntity):
             )
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True once the tracker's data has loaded."""
+        return self._cycle_data.loaded
+
     @callback
     def _handle_update(self) -> None:
-        """Handle update signal."""
-        self.async_write_ha_state()
+        """Write state only if the value or attributes changed since the last write."""
+        written = (self.available, self.native_value, self.extra_state_attributes)
+        if written != self._last_written:
+            self._last_written = written
+            self.async_write_ha_state()
 
 
 class CurrentPhaseSensor(CycleTrackerSensorBase):
@@ -114,6 +127,8 @@ class NextPeriodSensor(CycleTrackerSensorBase):
     """Sensor for predicted next period date."""
 
     _attr_icon = "mdi:calendar-clock"
+    # Day counters follow from the state and the date, so the recorder skips them.
+    _unrecorded_attributes = frozenset({ATTR_DAYS_UNTIL_NEXT, ATTR_DAYS_OVERDUE})
 
     def __init__(self, cycle_data: Any, entry: ConfigEntry, tracker_name: str) -> None:
         super().__init__(cycle_data, entry, tracker_name)
@@ -191,6 +206,8 @@ class TodaysSymptomsSensor(CycleTrackerSensorBase):
 
     _attr_icon = "mdi:clipboard-pulse"
     _attr_native_unit_of_measurement = "symptoms"
+    # The symptom log is the record of what was logged; keep it out of the recorder.
+    _unrecorded_attributes = frozenset({ATTR_SYMPTOMS, ATTR_SYMPTOMS_TRUNCATED})
 
     def __init__(self, cycle_data: Any, entry: ConfigEntry, tracker_name: str) -> None:
         super().__init__(cycle_data, entry, tracker_name)
@@ -203,4 +220,8 @@ class TodaysSymptomsSensor(CycleTrackerSensorBase):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        return {"symptoms": self._cycle_data.symptoms_today}
+        symptoms = self._cycle_data.symptoms_today
+        return {
+            ATTR_SYMPTOMS: list(symptoms[:MAX_SYMPTOM_ATTRIBUTES]),
+            ATTR_SYMPTOMS_TRUNCATED: len(symptoms) > MAX_SYMPTOM_ATTRIBUTES,
+        }
@@ -0,0 +1,110 @@
+"""Recorder long-term statistics for the Menstrual Cycle Tracker integration.
+
+Each completed cycle becomes one row per statistic, dated at local midnight
+of the cycle's start: its cycle length, its period length (when an end was
+logged) and the number of symptoms logged during it. A cycle is completed
+once the next one has started.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .history import OPEN_END
+
+STAT_CYCLE_LENGTH = "cycle_length"
+STAT_PERIOD_LENGTH = "period_length"
+STAT_SYMPTOM_COUNT = "symptom_count"
+
+# Statistic -> (name suffix, unit)
+_STATISTICS = {
+    STAT_CYCLE_LENGTH: ("cycle length", "days"),
+    STAT_PERIOD_LENGTH: ("period length", "days"),
+    STAT_SYMPTOM_COUNT: ("symptoms per cycle", "symptoms"),
+}
+
+
+def statistics_enabled(hass: HomeAssistant) -> bool:
+    """Return True if the recorder is running to receive statistics."""
+    return "recorder" in hass.config.components
+
+
+def statistic_id(entry_id: str, statistic: str) -> str:
+    """Return the external statistic id of a tracker's statistic."""
+    return f"{DOMAIN}:{entry_id.lower()}_{statistic}"
+
+
+def cycle_statistics(
+    starts: Sequence[int],
+    ends: Sequence[int],
+    symptom_days: Sequence[int],
+    first: int = 0,
+) -> dict[str, list[StatisticData]]:
+    """Return the rows of the completed cycles from index ``first`` on.
+
+    ``starts`` and ``ends`` are cycle columns as kept by CycleHistory and
+    ``symptom_days`` the sorted day ordinals of every logged symptom.
+    """
+    rows: dict[str, list[StatisticData]] = {statistic: [] for statistic in _STATISTICS}
+    for i in range(first, len(starts) - 1):
+        start, next_start = starts[i], starts[i + 1]
+        when = _row_start(start)
+        rows[STAT_CYCLE_LENGTH].append(_row(when, next_start - start))
+        if ends[i] != OPEN_END:
+            rows[STAT_PERIOD_LENGTH].append(_row(when, ends[i] - start + 1))
+        symptoms = bisect_left(symptom_days, next_start) - bisect_left(symptom_days, start)
+        rows[STAT_SYMPTOM_COUNT].append(_row(when, symptoms))
+    return rows
+
+
+@callback
+def async_publish_statistics(
+    hass: HomeAssistant, entry_id: str, name: str, rows: dict[str, list[StatisticData]]
+) -> None:
+    """Queue rows for the recorder; rows replace any stored for the same cycle."""
+    for statistic, data in rows.items():
+        if not data:
+            continue
+        suffix, unit = _STATISTICS[statistic]
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{name} {suffix}",
+            source=DOMAIN,
+            statistic_id=statistic_id(entry_id, statistic),
+            unit_of_measurement=unit,
+        )
+        async_add_external_statistics(hass, metadata, data)
+
+
+@callback
+def async_clear_statistics(hass: HomeAssistant, entry_id: str) -> None:
+    """Queue removal of every row of a tracker's statistics."""
+    get_instance(hass).async_clear_statistics(
+        [statistic_id(entry_id, statistic) for statistic in _STATISTICS]
+    )
+
+
+def _row(when: datetime, value: int) -> StatisticData:
+    """Return a statistics row holding a single value."""
+    return StatisticData(start=when, mean=value, min=value, max=value)
+
+
+def _row_start(ordinal: int) -> datetime:
+    """Return the first whole UTC hour of a local day, as the recorder requires.
+
+    That is local midnight, or 30 or 45 minutes past it in time zones with
+    a fractional UTC offset; rounding up keeps the row on its own day.
+    """
+    start = dt_util.as_utc(dt_util.start_of_local_day(date.fromordinal(ordinal)))
+    if start.minute:
+        start += timedelta(minutes=60 - start.minute)
+    return start
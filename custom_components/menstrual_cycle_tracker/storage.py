@@ -0,0 +1,326 @@
+"""On-disk storage helpers for the Menstrual Cycle Tracker integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+import csv
+from dataclasses import dataclass
+import gzip
+from itertools import islice
+import json
+import logging
+import os
+import tempfile
+from typing import IO, Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import ARCHIVE_CACHE_SIZE, DOMAIN, EXPORT_CHUNK_ROWS, EXPORT_FORMAT_CSV
+from .history import CycleHistory, SymptomLog, to_ordinal
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class CycleStore(Store[dict[str, Any]]):
+    """Main tracker store, upgrading older schemas when they are loaded.
+
+    Version 2 keeps cycles and symptoms as columns of integer day ordinals,
+    with null for an open cycle's end and symptom names stored once in a
+    table the rows refer to by index. Version 1 stored a dict of ISO date
+    strings per row. Home Assistant writes the migrated data back, so each
+    file is converted only once.
+    """
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate stored data to the current version."""
+        if old_major_version == 1:
+            old_data = {
+                "cycles": CycleHistory.from_storage(old_data.get("cycles", [])).as_columns(),
+                "symptoms": SymptomLog.from_storage(old_data.get("symptoms", [])).as_columns(),
+                "journal_seq": old_data.get("journal_seq", 0),
+                "archived_before": to_ordinal(old_data.get("archived_before")),
+            }
+        return old_data
+
+
+class CycleJournal:
+    """Append-only log of mutations kept next to a tracker's main Store.
+
+    Each record is one JSON array per line: ``[seq, op, *args]``. The Store
+    snapshot remembers the last sequence number folded into it, so records
+    at or below it are skipped on replay even if a crash interrupted
+    compaction before the journal was truncated.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, f"{DOMAIN}.journal.{entry_id}")
+        # Records written since the journal was last truncated.
+        self.size = 0
+        self._buffer: list[str] = []
+        self._lock = asyncio.Lock()
+
+    async def async_read(self) -> list[list[Any]]:
+        """Return every record on disk."""
+        records = await self.hass.async_add_executor_job(self._read)
+        self.size = len(records)
+        return records
+
+    def append(self, record: list[Any]) -> None:
+        """Buffer a record; async_flush writes it."""
+        self._buffer.append(json.dumps(record, separators=(",", ":")))
+
+    @property
+    def pending(self) -> bool:
+        """Return True if records are waiting to be written."""
+        return bool(self._buffer)
+
+    async def async_flush(self) -> None:
+        """Append buffered records to the file, preserving their order."""
+        async with self._lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            await self.hass.async_add_executor_job(self._write, lines)
+            self.size += len(lines)
+
+    async def async_compact(self, save_snapshot: Callable[[], Awaitable[None]]) -> None:
+        """Write a snapshot covering every record, then empty the journal.
+
+        ``save_snapshot`` must capture the data before its first await; records
+        buffered up to that point are folded into it and dropped, anything
+        logged while it runs stays buffered for the next flush.
+        """
+        async with self._lock:
+            self._buffer.clear()
+            await save_snapshot()
+            await self.hass.async_add_executor_job(self._truncate)
+            self.size = 0
+
+    def _read(self) -> list[list[Any]]:
+        """Read and decode the journal file."""
+        records: list[list[Any]] = []
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # A torn final line from an interrupted append; the
+                        # records before it are still valid.
+                        _LOGGER.warning("Ignoring corrupt record in %s", self.path)
+                        break
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the journal file."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def _truncate(self) -> None:
+        """Empty the journal file."""
+        try:
+            os.truncate(self.path, 0)
+        except FileNotFoundError:
+            pass
+
+
+class CycleArchive:
+    """Compressed per-year segments holding history past the retention window.
+
+    Segments live in ``.storage/menstrual_cycle_tracker.archive.<entry_id>/``
+    as ``<year>.json.gz`` and are only read when a query reaches back into
+    archived years. The few most recently read years are kept parsed.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.directory = hass.config.path(STORAGE_DIR, f"{DOMAIN}.archive.{entry_id}")
+        self._cache: OrderedDict[int, tuple[CycleHistory, SymptomLog]] = OrderedDict()
+
+    async def async_get_year(self, year: int) -> tuple[CycleHistory, SymptomLog]:
+        """Return the archived cycles and symptoms of ``year``."""
+        if year in self._cache:
+            self._cache.move_to_end(year)
+            return self._cache[year]
+        raw = await self.hass.async_add_executor_job(self._read, year)
+        segment = (
+            CycleHistory.from_storage(raw.get("cycles", [])),
+            SymptomLog.from_storage(raw.get("symptoms", [])),
+        )
+        self._cache[year] = segment
+        if len(self._cache) > ARCHIVE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return segment
+
+    async def async_years(self) -> list[int]:
+        """Return the years that have a segment, ascending."""
+        return await self.hass.async_add_executor_job(self._years)
+
+    async def async_read_raw(self, year: int) -> dict[str, list[dict[str, str]]]:
+        """Return the stored form of a year's segment (empty if none)."""
+        return await self.hass.async_add_executor_job(self._read, year)
+
+    async def async_write(self, year: int, data: dict[str, list[dict[str, str]]]) -> None:
+        """Replace a year's segment."""
+        self._cache.pop(year, None)
+        await self.hass.async_add_executor_job(self._write, year, data)
+
+    def _path(self, year: int) -> str:
+        """Return the file path of a year's segment."""
+        return os.path.join(self.directory, f"{year}.json.gz")
+
+    def _years(self) -> list[int]:
+        """List the segment files on disk."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(int(name[:-8]) for name in names if name.endswith(".json.gz"))
+
+    def _read(self, year: int) -> dict[str, list[dict[str, str]]]:
+        """Read and decompress a segment."""
+        try:
+            with gzip.open(self._path(year), "rt", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, year: int, data: dict[str, list[dict[str, str]]]) -> None:
+        """Compress and atomically replace a segment."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(year)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+
+@dataclass(slots=True)
+class ExportSource:
+    """One tracker's history, detached from the event loop for export."""
+
+    name: str
+    archive: CycleArchive
+    archive_years: list[int]
+    cycles: CycleHistory
+    symptoms: SymptomLog
+
+
+def write_export(path: str, fmt: str, sources: list[ExportSource]) -> tuple[str, int, int]:
+    """Write the sources' history near ``path``; return the path written and the counts.
+
+    Runs in the executor. Archived years are read one at a time and rows
+    are written in chunks, so memory use stays flat however long the
+    history is. The file only appears once it is complete, and never
+    replaces an existing export: if ``path`` is taken, ``_2``, ``_3`` and
+    so on are added to the name.
+    """
+    directory, name = os.path.split(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=f".{name}.", dir=directory)
+    try:
+        with open(fd, "w", encoding="utf-8", newline="") as file:
+            if fmt == EXPORT_FORMAT_CSV:
+                cycles, symptoms = _write_csv(file, sources)
+            else:
+                cycles, symptoms = _write_json(file, sources)
+        path = _link_unique(tmp_path, path)
+    finally:
+        os.unlink(tmp_path)
+    return path, cycles, symptoms
+
+
+def _link_unique(source: str, path: str) -> str:
+    """Hard-link ``source`` to ``path``, or to the first free numbered variant of it."""
+    stem, ext = os.path.splitext(path)
+    candidate, number = path, 1
+    while True:
+        try:
+            os.link(source, candidate)
+        except FileExistsError:
+            number += 1
+            candidate = f"{stem}_{number}{ext}"
+        else:
+            return candidate
+
+
+def _write_csv(file: IO[str], sources: list[ExportSource]) -> tuple[int, int]:
+    """Write one row per cycle and symptom, tagged with tracker and record type."""
+    writer = csv.writer(file)
+    writer.writerow(("tracker", "record", "date", "end_date", "symptom", "severity"))
+    cycles = symptoms = 0
+    for source in sources:
+        for chunk in _chunks(_cycle_rows(source)):
+            writer.writerows(
+                (source.name, "cycle", row["start_date"], row["end_date"], "", "")
+                for row in chunk
+            )
+            cycles += len(chunk)
+        for chunk in _chunks(_symptom_rows(source)):
+            writer.writerows(
+                (source.name, "symptom", row["date"], "", row["symptom"], row["severity"])
+                for row in chunk
+            )
+            symptoms += len(chunk)
+    return cycles, symptoms
+
+
+def _write_json(file: IO[str], sources: list[ExportSource]) -> tuple[int, int]:
+    """Write each tracker's cycles and symptoms in the shape import_history accepts."""
+    cycles = symptoms = 0
+    file.write('{"trackers":[')
+    for index, source in enumerate(sources):
+        file.write(f'{"," if index else ""}{{"tracker":{json.dumps(source.name)},"cycles":[')
+        cycles += _write_json_items(file, _cycle_rows(source))
+        file.write('],"symptoms":[')
+        symptoms += _write_json_items(file, _symptom_rows(source))
+        file.write("]}")
+    file.write("]}\n")
+    return cycles, symptoms
+
+
+def _write_json_items(file: IO[str], rows: Iterable[dict[str, str]]) -> int:
+    """Write rows as comma-separated JSON objects and return how many were written."""
+    count = 0
+    for chunk in _chunks(rows):
+        if count:
+            file.write(",")
+        file.write(",".join(json.dumps(row, separators=(",", ":")) for row in chunk))
+        count += len(chunk)
+    return count
+
+
+def _cycle_rows(source: ExportSource) -> Iterator[dict[str, str]]:
+    """Yield a tracker's archived, then in-memory, cycles oldest first."""
+    for year in source.archive_years:
+        yield from source.archive._read(year).get("cycles", [])
+    for start, end in source.cycles:
+        yield {"start_date": start.isoformat(), "end_date": end.isoformat() if end else ""}
+
+
+def _symptom_rows(source: ExportSource) -> Iterator[dict[str, str]]:
+    """Yield a tracker's archived, then in-memory, symptoms oldest first."""
+    for year in source.archive_years:
+        yield from source.archive._read(year).get("symptoms", [])
+    yield from source.symptoms
+
+
+def _chunks(rows: Iterable[_T]) -> Iterator[list[_T]]:
+    """Split rows into lists of at most EXPORT_CHUNK_ROWS."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, EXPORT_CHUNK_ROWS)):
+        yield chunk
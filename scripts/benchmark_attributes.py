@@ -0,0 +1,155 @@
+"""Measure the state attributes the recorder stores for the tracker's entities.
+
+Loads the integration twice, from a baseline git revision and from the
+working tree, populates a CycleData with the same history in each, and
+builds the real Next Period, Period Active and Today's Symptoms entities
+on top of it. Their attributes are then encoded the way the recorder
+stores them, honouring each entity's unrecorded attributes.
+
+    python scripts/benchmark_attributes.py <baseline revision> --symptoms 25
+
+Home Assistant and the recorder's requirements must be installed; no
+Home Assistant instance is started and nothing is written to disk.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import timedelta
+import importlib
+import io
+from pathlib import Path
+import subprocess
+import sys
+import tarfile
+import tempfile
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+REPO_PATH = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.menstrual_cycle_tracker"
+
+SYMPTOMS = (
+    "cramps", "headache", "bloating", "fatigue", "acne", "back pain",
+    "mood swings", "nausea", "tender breasts", "insomnia",
+)
+
+# (entity id, module, class)
+ENTITIES = (
+    ("sensor.alex_next_period", "sensor", "NextPeriodSensor"),
+    ("binary_sensor.alex_period_active", "binary_sensor", "PeriodActiveSensor"),
+    ("sensor.alex_today_s_symptoms", "sensor", "TodaysSymptomsSensor"),
+)
+
+
+def extract_revision(revision: str, directory: str) -> str:
+    """Write the integration as of a git revision under ``directory`` and return it."""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "custom_components/menstrual_cycle_tracker"],
+        cwd=REPO_PATH,
+        check=True,
+        capture_output=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory, filter="data")
+    return directory
+
+
+def import_integration(root: str) -> ModuleType:
+    """Import the integration package found under ``root``, replacing any loaded copy."""
+    for name in [name for name in sys.modules if name.startswith("custom_components")]:
+        del sys.modules[name]
+    sys.path.insert(0, root)
+    try:
+        return importlib.import_module(PACKAGE)
+    finally:
+        sys.path.remove(root)
+
+
+def populate(integration: ModuleType, hass: HomeAssistant, symptoms: int) -> Any:
+    """Return a loaded CycleData with an active period and symptoms logged today."""
+    history = importlib.import_module(f"{PACKAGE}.history")
+    # CycleData only reads these fields of its config entry.
+    entry = SimpleNamespace(entry_id="benchmark", data={"name": "Alex"}, options={}, title="Alex")
+    cycle_data = integration.CycleData(hass, entry)
+    today = dt_util.now().date()
+    starts = [today - timedelta(days=2 + 28 * i) for i in range(6, -1, -1)]
+    cycle_data.cycles = history.CycleHistory.from_storage(
+        [
+            {
+                "start_date": start.isoformat(),
+                "end_date": "" if start == starts[-1] else (start + timedelta(days=4)).isoformat(),
+            }
+            for start in starts
+        ]
+    )
+    cycle_data.symptoms = history.SymptomLog.from_storage(
+        [
+            {
+                "date": today.isoformat(),
+                "symptom": SYMPTOMS[i % len(SYMPTOMS)],
+                "severity": ("mild", "moderate", "severe")[i % 3],
+            }
+            for i in range(symptoms)
+        ]
+    )
+    cycle_data.loaded = True
+    return cycle_data
+
+
+def recorded_size(entity_id: str, entity: Any) -> int:
+    """Return the bytes the recorder stores for the entity's attributes."""
+    attributes = dict(entity.extra_state_attributes or {})
+    if entity.icon:
+        attributes["icon"] = entity.icon
+    if getattr(entity, "unit_of_measurement", None):
+        attributes["unit_of_measurement"] = entity.unit_of_measurement
+    # The same union Entity puts in the state info the recorder reads.
+    unrecorded = entity._entity_component_unrecorded_attributes | entity._unrecorded_attributes
+    state = State(entity_id, "0", attributes, state_info={"unrecorded_attributes": unrecorded})
+    event = Event(EVENT_STATE_CHANGED, {"entity_id": entity_id, "new_state": state})
+    return len(StateAttributes.shared_attrs_bytes_from_event(event, None))
+
+
+async def measure(root: str, symptoms: int) -> list[int]:
+    """Return the recorded attribute size of each entity with the integration under ``root``."""
+    integration = import_integration(root)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        cycle_data = populate(integration, hass, symptoms)
+        sizes = []
+        for entity_id, module, class_name in ENTITIES:
+            entity_class = getattr(importlib.import_module(f"{PACKAGE}.{module}"), class_name)
+            entity = entity_class(cycle_data, cycle_data.entry, "Alex")
+            sizes.append(recorded_size(entity_id, entity))
+        return sizes
+
+
+async def run(baseline: str, symptoms: int) -> None:
+    """Measure both versions of the integration and print a comparison table."""
+    with tempfile.TemporaryDirectory() as directory:
+        before = await measure(extract_revision(baseline, directory), symptoms)
+    after = await measure(str(REPO_PATH), symptoms)
+    print(f"{symptoms} symptoms logged today; recorded attribute bytes per state write")
+    print(f"{'':<34}{baseline:>12}{'working tree':>14}")
+    for (entity_id, _, _), old, new in zip(ENTITIES, before, after):
+        print(f"{entity_id:<34}{old:>12}{new:>14}")
+    print(f"{'total':<34}{sum(before):>12}{sum(after):>14}")
+
+
+def main() -> None:
+    """Parse arguments and run the measurement."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="git revision to compare the working tree with")
+    parser.add_argument("--symptoms", type=int, default=25, help="symptoms logged today")
+    args = parser.parse_args()
+    asyncio.run(run(args.baseline, args.symptoms))
+
+
+if __name__ == "__main__":
+    main()
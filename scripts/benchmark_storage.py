@@ -0,0 +1,157 @@
+"""Compare the version 1 and version 2 storage schemas on synthetic trackers.
+
+Builds a large synthetic history, then times a full save (encode + JSON
+dump) and load (JSON parse + decode) in each schema, the one-off v1 -> v2
+migration, and reports the size of each file.
+
+    python scripts/benchmark_storage.py --cycles 2000 --symptoms 100000
+
+Only the integration's history module is imported, so Home Assistant does
+not need to be installed. Home Assistant's Store uses orjson rather than
+the standard library, which makes both schemas faster but keeps the ratio.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import date, timedelta
+import importlib.util
+import json
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Any, Callable
+
+HISTORY_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "menstrual_cycle_tracker"
+    / "history.py"
+)
+
+SYMPTOMS = (
+    "cramps", "headache", "bloating", "fatigue", "acne", "back pain",
+    "mood swings", "nausea", "tender breasts", "insomnia",
+)
+
+
+def load_history_module() -> Any:
+    """Import history.py on its own, skipping the package's Home Assistant imports."""
+    spec = importlib.util.spec_from_file_location("history", HISTORY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["history"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_v1(cycles: int, symptoms: int, seed: int) -> dict[str, Any]:
+    """Return a version 1 document with the given number of rows."""
+    rng = random.Random(seed)
+    day = date(2000, 1, 1)
+    rows = []
+    for i in range(cycles):
+        end = "" if i == cycles - 1 else (day + timedelta(days=rng.randint(3, 7))).isoformat()
+        rows.append({"start_date": day.isoformat(), "end_date": end})
+        day += timedelta(days=rng.randint(24, 34))
+    span = (day - date(2000, 1, 1)).days
+    logged = sorted(
+        (
+            {
+                "date": (date(2000, 1, 1) + timedelta(days=rng.randrange(span))).isoformat(),
+                "symptom": rng.choice(SYMPTOMS),
+                "severity": rng.choice(("", "mild", "moderate", "severe")),
+            }
+            for _ in range(symptoms)
+        ),
+        key=lambda row: row["date"],
+    )
+    return {"cycles": rows, "symptoms": logged, "journal_seq": 0, "archived_before": ""}
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """Return the fastest of ``repeat`` runs of ``func`` in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--symptoms", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    history = load_history_module()
+    CycleHistory, SymptomLog = history.CycleHistory, history.SymptomLog
+
+    v1 = synthetic_v1(args.cycles, args.symptoms, args.seed)
+    cycles = CycleHistory.from_storage(v1["cycles"])
+    symptoms = SymptomLog.from_storage(v1["symptoms"])
+
+    def save_v1() -> str:
+        return json.dumps(
+            {
+                "cycles": cycles.as_storage(),
+                "symptoms": symptoms.as_storage(),
+                "journal_seq": 0,
+                "archived_before": "",
+            }
+        )
+
+    def save_v2() -> str:
+        return json.dumps(
+            {
+                "cycles": cycles.as_columns(),
+                "symptoms": symptoms.as_columns(),
+                "journal_seq": 0,
+                "archived_before": None,
+            }
+        )
+
+    v1_text = save_v1()
+    v2_text = save_v2()
+
+    def load_v1() -> None:
+        raw = json.loads(v1_text)
+        CycleHistory.from_storage(raw["cycles"])
+        SymptomLog.from_storage(raw["symptoms"])
+
+    def load_v2() -> None:
+        raw = json.loads(v2_text)
+        CycleHistory.from_columns(raw["cycles"])
+        SymptomLog.from_columns(raw["symptoms"])
+
+    def migrate() -> None:
+        raw = json.loads(v1_text)
+        json.dumps(
+            {
+                "cycles": CycleHistory.from_storage(raw["cycles"]).as_columns(),
+                "symptoms": SymptomLog.from_storage(raw["symptoms"]).as_columns(),
+            }
+        )
+
+    # The migrated document must decode to exactly the same history.
+    raw = json.loads(v2_text)
+    assert list(CycleHistory.from_columns(raw["cycles"])) == list(cycles)
+    assert list(SymptomLog.from_columns(raw["symptoms"])) == list(symptoms)
+
+    rows = [
+        ("save (ms)", best_of(args.repeat, save_v1), best_of(args.repeat, save_v2)),
+        ("load (ms)", best_of(args.repeat, load_v1), best_of(args.repeat, load_v2)),
+        ("size (KiB)", len(v1_text.encode()) / 1024, len(v2_text.encode()) / 1024),
+    ]
+    print(f"{args.cycles} cycles, {args.symptoms} symptoms, best of {args.repeat}")
+    print(f"{'':<12}{'v1':>12}{'v2':>12}{'v2/v1':>9}")
+    for label, old, new in rows:
+        print(f"{label:<12}{old:>12.1f}{new:>12.1f}{new / old:>9.2f}")
+    print(f"{'migrate (ms)':<12}{best_of(args.repeat, migrate):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()